@@ -1,58 +1,39 @@
-from math import pi, sqrt, atan2, cos, sin
+from math import pi, cos, sin
 
-from drawing_functions import *
+from casioplot import *
 
 R_2D = pi / 3  # 2D rotation angle (radians)
 R_3D = pi / 6  # 3D rotation angle (radians)
 
+# the 8 corners of a cube
+CUBE_VERTICES = [(x, y, z) for x in (-50, 50) for y in (-50, 50) for z in (-50, 50)]
 
-def dist(x, y):
-    """Get the distance between a point and the origin."""
-    return sqrt(x ** 2 + y ** 2)
+# the 12 edges of the cube, as indices of CUBE_VERTICES, and their colors
+CUBE_EDGES = [
+    (0, 4), (2, 6), (1, 5), (3, 7),  # parallel to x
+    (0, 2), (4, 6), (1, 3), (5, 7),  # parallel to y
+    (0, 1), (4, 5), (2, 3), (6, 7),  # parallel to z
+]
+CUBE_COLORS = [(255, 0, 0)] * 4 + [(0, 255, 0)] * 4 + [(0, 0, 255)] * 4
 
 
-def rotate_2d(x, y, a):
-    """Rotate a point with the given angle (in radians) and the origin."""
-    d = dist(x, y)
-    b = atan2(y, x) + a
-    # if x < 0:
-    #     b += pi
-    return cos(b) * d, sin(b) * d
+def cube_matrix(r2d, r3d):
+    """The matrix that applies the two rotations to get a 2D image of a 3D point.
 
-
-def rotate_3d(x, y, z, a):
-    """Simulate a 3D rotation (a in radians)"""
-    return x, sin(a) * y + z * cos(a)
-
-
-def d2_to_d3(x, y, z, r2d, r3d):
-    """Apply the two rotations to get a 2D image of a 3D point."""
-    x, y = rotate_2d(x, y, r2d)
-    x, y = rotate_3d(x, y, z, r3d)
-    return x + 192, y + 192/2
+    First a 2D rotation of (x, y) with the angle r2d, then a simulated 3D rotation
+    (the new y is sin(r3d) * y + cos(r3d) * z).
+    """
+    return [
+        [cos(r2d), -sin(r2d), 0],
+        [sin(r3d) * sin(r2d), sin(r3d) * cos(r2d), cos(r3d)],
+        [0, 0, 1],
+    ]
 
 
 def draw_cube(r2d, r3d):
-    # Draw each edges of a cube
-    # from the lowest corner
-    draw_line(d2_to_d3(-50, -50, -50, r2d, r3d), d2_to_d3(50, -50, -50, r2d, r3d), (255, 0, 0, 255))
-    draw_line(d2_to_d3(-50, -50, -50, r2d, r3d), d2_to_d3(-50, 50, -50, r2d, r3d), (0, 255, 0, 255))
-    draw_line(d2_to_d3(-50, -50, -50, r2d, r3d), d2_to_d3(-50, -50, 50, r2d, r3d), (0, 0, 255, 255))
-
-    # from the highest corner
-    draw_line(d2_to_d3(50, 50, 50, r2d, r3d), d2_to_d3(-50, 50, 50, r2d, r3d), (255, 0, 0, 255))
-    draw_line(d2_to_d3(50, 50, 50, r2d, r3d), d2_to_d3(50, -50, 50, r2d, r3d), (0, 255, 0, 255))
-    draw_line(d2_to_d3(50, 50, 50, r2d, r3d), d2_to_d3(50, 50, -50, r2d, r3d), (0, 0, 255, 255))
-
-    # Other edges
-    draw_line(d2_to_d3(-50, -50, 50, r2d, r3d), d2_to_d3(-50, 50, 50, r2d, r3d), (0, 255, 0, 255))
-    draw_line(d2_to_d3(-50, -50, 50, r2d, r3d), d2_to_d3(50, -50, 50, r2d, r3d), (255, 0, 0, 255))
-
-    draw_line(d2_to_d3(-50, 50, -50, r2d, r3d), d2_to_d3(50, 50, -50, r2d, r3d), (255, 0, 0, 255))
-    draw_line(d2_to_d3(-50, 50, -50, r2d, r3d), d2_to_d3(-50, 50, 50, r2d, r3d), (0, 0, 255, 255))
-
-    draw_line(d2_to_d3(50, -50, -50, r2d, r3d), d2_to_d3(50, 50, -50, r2d, r3d), (0, 255, 0, 255))
-    draw_line(d2_to_d3(50, -50, -50, r2d, r3d), d2_to_d3(50, -50, 50, r2d, r3d), (0, 0, 255, 255))
+    # all the corners are transformed at once, then all the edges are drawn at once
+    points = transform_vertices(CUBE_VERTICES, cube_matrix(r2d, r3d), offset=(192, 192 / 2))
+    draw_lines(edge_segments(points, CUBE_EDGES), CUBE_COLORS)
 
 
 for i in range(1000):
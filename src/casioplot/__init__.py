@@ -1,8 +1,54 @@
 """Casioplot package
 
-All public functions from the :py:mod:`casioplot` module are accessible in this package.
+All public functions from the :py:mod:`casioplot`, :py:mod:`shapes`, :py:mod:`transform`
+and :py:mod:`font_compiler` modules
+are accessible in this package.
 """
 
-from casioplot.casioplot import set_pixel, get_pixel, draw_string, show_screen, clear_screen
+from casioplot.casioplot import (
+    set_pixel,
+    get_pixel,
+    set_pixels,
+    get_pixels,
+    set_region,
+    get_region,
+    draw_image,
+    draw_string,
+    draw_text_box,
+    text_size,
+    text_cache_info,
+    show_screen,
+    frame_info,
+    clear_screen,
+    clear_depth_buffer,
+    fill_rect,
+    hline,
+    vline,
+    create_layer,
+    select_layer,
+    delete_layer,
+    push_clip,
+    pop_clip,
+    copy_rect,
+    scroll,
+)
+from casioplot.shapes import (
+    draw_line,
+    draw_aa_line,
+    draw_lines,
+    draw_polygon,
+    draw_circle,
+    draw_ellipse,
+    draw_triangles,
+)
+from casioplot.transform import (
+    transform_vertices,
+    edge_segments,
+    rotation_matrix,
+    translation_matrix,
+    perspective_matrix,
+    combine_matrices,
+)
+from casioplot.font_compiler import load_font
 
 __version__ = "3.4.1"
@@ -0,0 +1,164 @@
+"""Contains the rendering backends
+
+A backend takes the framebuffer from :file:`casioplot.py` and presents it to the user.
+The drawing functions never talk to a backend, only :py:func:`casioplot.casioplot.show_screen`
+and the exit handler do, so every backend draws at the same speed.
+
+Available backends:
+  - :py:class:`_TkBackend`, shows the screen in a tkinter window
+  - :py:class:`_HeadlessBackend`, keeps the screen in memory only, no display needed
+
+:py:func:`_create_backend` picks the backend from the settings.
+"""
+
+import tkinter as tk
+
+from PIL import Image, ImageTk  # ImageTk converts the background image for tkinter
+from casioplot.settings import _settings
+from casioplot.types import Rect
+
+
+def _region_bytes(framebuffer: bytearray, width: int, region: Rect, bytes_per_pixel: int = 3) -> bytes:
+    """Copies the pixels of a region of the framebuffer, row after row
+
+    :param framebuffer: The framebuffer
+    :param width: The width of the framebuffer in pixels
+    :param region: The region to copy
+    :param bytes_per_pixel: The number of bytes of a pixel, 3 for RGB
+    :return: The pixels of the region
+    """
+    x0, y0, x1, y1 = region
+    if x0 == 0 and x1 == width:  # full rows are contiguous in memory
+        return bytes(framebuffer[y0 * width * bytes_per_pixel:y1 * width * bytes_per_pixel])
+
+    return b"".join(
+        framebuffer[(y * width + x0) * bytes_per_pixel:(y * width + x1) * bytes_per_pixel]
+        for y in range(y0, y1)
+    )
+
+
+class _Backend:
+    """Base class of the backends, it doesn't show anything
+
+    :param width: Width of the canvas in pixels
+    :param height: Height of the canvas in pixels
+    :param background: The background image, the canvas is placed over it using the margins
+    """
+
+    name = "base"
+    """The name of the backend"""
+
+    def __init__(self, width: int, height: int, background: Image.Image) -> None:
+        self.width = width
+        self.height = height
+        self.background = background
+
+    def present(self, framebuffer: bytearray, regions: list[Rect]) -> None:
+        """Shows the content of the framebuffer
+
+        :param framebuffer: The framebuffer, 3 bytes (RGB) per pixel, row after row
+        :param regions: The regions of the framebuffer that changed since the last call
+        """
+
+    def copy(self, region: Rect, x: int, y: int) -> None:
+        """Moves a region of the shown screen, called before :py:meth:`present`
+
+        The framebuffer given to the next call of :py:meth:`present` already contains the moved region,
+        so backends that keep a copy of the screen can move it instead of uploading it again.
+
+        :param region: The region to move
+        :param x: x coordinate of the new position of the region
+        :param y: y coordinate of the new position of the region
+        """
+
+    def run_at_exit(self) -> None:
+        """Called once when the program ends"""
+
+
+class _HeadlessBackend(_Backend):
+    """Backend that keeps the screen in memory only
+
+    Used when ``show_screen`` is False or when there is no display (CI, servers, ...).
+    The screen can still be saved with the ``[saving_screen]`` settings.
+    """
+
+    name = "headless"
+
+
+class _TkBackend(_Backend):
+    """Backend that shows the screen in a tkinter window
+
+    :raise tk.TclError: Raise a :py:exc:`tk.TclError` if the window can't be created
+    """
+
+    name = "tkinter"
+
+    def __init__(self, width: int, height: int, background: Image.Image) -> None:
+        super().__init__(width, height, background)
+
+        self.window = tk.Tk()
+        """The tkinter window that shows the virtual screen"""
+        self.window.geometry("{}x{}".format(*background.size))
+        self.window.title("casioplot")
+        self.window.grab_release()
+        self.window.attributes("-topmost", True)
+        self.window.resizable(False, False)
+
+        self.canvas = tk.PhotoImage(master=self.window, width=width, height=height)
+        """The tkinter image that shows the framebuffer"""
+        self.canvas.put("white", to=(0, 0, width, height))  # ensures the pixels are white and not transparent
+        self.background_image = ImageTk.PhotoImage(background, master=self.window)
+        """The background image converted for tkinter"""
+
+        self.background_display = tk.Label(master=self.window, image=self.background_image, border=0)
+        """The tkinter label that shows the background image"""
+        self.canvas_display = tk.Label(master=self.window, image=self.canvas, border=0)
+        """The tkinter label that shows the canvas"""
+        self.background_display.place(x=0, y=0)
+        self.canvas_display.place(x=_settings["left"], y=_settings["top"])
+
+    def present(self, framebuffer: bytearray, regions: list[Rect]) -> None:
+        """Uploads the changed regions to the tkinter canvas and updates the window
+
+        Every region is sent in a single call as binary PPM data, that way tkinter doesn't need
+        to parse a color string for every pixel
+        """
+        for region in regions:
+            x0, y0, x1, y1 = region
+            self.canvas.tk.call(
+                self.canvas.name, "put",
+                b"P6 %d %d 255\n" % (x1 - x0, y1 - y0) + _region_bytes(framebuffer, self.width, region),
+                "-format", "ppm",
+                "-to", x0, y0
+            )
+        self.window.update()
+
+    def copy(self, region: Rect, x: int, y: int) -> None:
+        """Moves a region of the tkinter canvas, without sending its pixels again"""
+        self.canvas.tk.call(self.canvas.name, "copy", self.canvas.name, "-from", *region, "-to", x, y)
+
+    def run_at_exit(self) -> None:
+        """Keeps the tkinter window open after the program ends if ``close_window`` is False"""
+        if _settings["close_window"] is False:
+            self.window.mainloop()
+
+
+def _create_backend(width: int, height: int, background: Image.Image) -> _Backend:
+    """Creates the backend selected by the settings
+
+    If ``show_screen`` is True the tkinter backend is used, otherwise the headless one.
+    If the tkinter window can't be created, for example without a display,
+    the headless backend is used instead.
+
+    :param width: Width of the canvas in pixels
+    :param height: Height of the canvas in pixels
+    :param background: The background image
+    :return: The backend
+    """
+    if _settings["show_screen"] is True:
+        try:
+            return _TkBackend(width, height, background)
+        except tk.TclError:
+            print("The tkinter window couldn't be created. The screen won't be shown.")
+
+    return _HeadlessBackend(width, height, background)
@@ -2,21 +2,61 @@
 
 Available functions for the user:
   - :py:func:`show_screen`
+  - :py:func:`frame_info`
   - :py:func:`clear_screen`
+  - :py:func:`clear_depth_buffer`
+  - :py:func:`fill_rect`
+  - :py:func:`hline`
+  - :py:func:`vline`
   - :py:func:`set_pixel`
   - :py:func:`get_pixel`
+  - :py:func:`set_pixels`
+  - :py:func:`get_pixels`
+  - :py:func:`set_region`
+  - :py:func:`get_region`
+  - :py:func:`draw_image`
   - :py:func:`draw_string`
+  - :py:func:`draw_text_box`
+  - :py:func:`text_size`
+  - :py:func:`text_cache_info`
+  - :py:func:`create_layer`
+  - :py:func:`select_layer`
+  - :py:func:`delete_layer`
+  - :py:func:`push_clip`
+  - :py:func:`pop_clip`
+  - :py:func:`copy_rect`
+  - :py:func:`scroll`
 
 Contains the original functions from the :py:mod:`casioplot` calculator module
 and the code needed to emulate the screen.
 """
 import atexit
-import tkinter as tk
-
-from PIL import Image, ImageTk  # used to save the screen
-from casioplot.characters import _get_char
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import repeat
+from math import inf
+from time import perf_counter, sleep
+
+from PIL import Image  # used to save the screen
+from casioplot.backends import _create_backend, _region_bytes
+from casioplot.colors import (
+    _RED_TO_565,
+    _GREEN_TO_565,
+    _BLUE_TO_565,
+    _color_to_rgb565,
+    _composite_bytes,
+    _correct_colors_bytes,
+    _opaque_mask,
+    _or_bytes,
+    _rgb565_to_color,
+    _rgb565_to_rgb,
+    _rgb_to_rgb565,
+)
+from casioplot.characters import _get_metrics
+from casioplot.glyphs import _get_glyph
 from casioplot.settings import _settings
-from casioplot.types import Color, Text_size
+from casioplot.types import Color, Rect, Span, Text_size
 
 # some frequently used colors
 _WHITE: Color = (255, 255, 255)
@@ -25,6 +65,79 @@ _WHITE: Color = (255, 255, 255)
 _BLACK: Color = (0, 0, 0)
 """RGB black"""
 
+_Sprite = tuple[int, int, list[list[tuple[int, bytes]]]]
+"""A sprite converted by :py:func:`_convert_sprite`, ``(width, height, rows)``
+
+Every row is a list of runs of opaque pixels ``(x, pixels)``, the pixels are in the format of the framebuffer
+"""
+
+_SPRITE_CACHE_SIZE = 256
+"""Maximum number of sprites kept in :py:data:`_sprite_cache`"""
+
+_sprite_cache: dict[tuple, tuple[object, _Sprite]] = {}
+"""The sprites already converted by :py:func:`draw_image`, with the images they come from
+
+:meta hide-value:
+"""
+
+
+class _Layer:
+    """A layer created by :py:func:`create_layer`, with its own framebuffer
+
+    :param z: The position of the layer, below the canvas if negative and above it otherwise
+    :param transparent: The bytes of the transparent pixel, None if the layer is opaque
+    """
+
+    def __init__(self, z: int, transparent: bytes | None) -> None:
+        self.z = z
+        self.transparent = transparent
+        self.blank: bytes = _blank_framebuffer if transparent is None else transparent * (_width * _height)
+        """The content of the layer after :py:func:`clear_screen`"""
+        self.framebuffer = bytearray(self.blank)
+        """The pixels of the layer, in the same format as :py:data:`_framebuffer`"""
+        self.dirty = True
+        """If True the whole layer must be composited again"""
+        self.changed: list[Rect] = []
+        """The regions drawn on the layer since it was last composited, only they are composited again"""
+        self.pixels = bytearray()
+        """The composite of the layers of the same side of the canvas, up to this one included"""
+        self.mask = bytearray()
+        """The mask of :py:attr:`pixels`, see :py:func:`casioplot.colors._opaque_mask`"""
+
+    def opaque_mask(self, pixels: bytes | None = None) -> bytes:
+        """Creates the mask of the opaque pixels of the layer, or of some pixels of the layer
+
+        :param pixels: Some pixels of the layer, by default all its pixels
+        """
+        if pixels is None:
+            pixels = self.framebuffer
+        if self.transparent is None:
+            return b"\xff" * len(pixels)
+        return _opaque_mask(pixels, self.transparent)
+
+
+_TextMask = tuple[int, int, bytes]
+"""A string rendered by :py:func:`_render_string`, ``(width, height, mask)``
+
+The mask has the format of :py:func:`casioplot.colors._opaque_mask`, with the size of a pixel of the framebuffer
+"""
+
+_BITS_TO_MASK = tuple(bytes(0xFF if value >> bit & 1 else 0 for bit in range(8)) for value in range(256))
+"""For every byte of a bitmask, the 8 bytes of the mask, the first one is the least significant bit"""
+
+_string_cache: dict[tuple, _TextMask] = {}
+"""The strings already drawn by :py:func:`draw_string`, by text, size, scale and bold, the color doesn't matter
+
+The boxes of :py:func:`draw_text_box` are also kept, by text, size, scale, bold, width and height.
+
+The least recently used string is the first one, every string that is drawn again is moved to the end.
+
+:meta hide-value:
+"""
+
+_string_cache_stats = {"hits": 0, "misses": 0, "memory": 0}
+"""The number of strings found and not found in :py:data:`_string_cache` and the memory it uses"""
+
 # these two are only used if the setting save_multiple is set to True
 _save_screen_counter = 1
 """Counter used to save multiple images of the screen"""
@@ -43,6 +156,822 @@ def _screen_dimensions() -> tuple[int, int]:
     )
 
 
+def _front_buffer_image() -> Image.Image:
+    """Creates a PIL image with the content of :py:data:`_front_buffer`"""
+    return Image.frombytes("RGB", (_width, _height), bytes(_front_buffer))
+
+
+def _as_list(values: Sequence) -> Sequence:
+    """Converts NumPy arrays to lists, iterating over a list is much faster than over an array"""
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return values
+
+
+def _set_pixels_array(xs, ys, colors) -> None:
+    """Sets many pixels given with NumPy arrays, used by :py:func:`set_pixels`
+
+    The clipping, the correction of the colors and the writes are done with NumPy over the whole arrays,
+    directly in the framebuffer.
+
+    :param xs: x coordinates (from the left)
+    :param ys: y coordinates (from the top)
+    :param colors: A single color for every pixel or a color for each pixel
+    :raise ValueError: Raise a :py:exc:`ValueError` if the arguments don't have the same length
+    """
+    numpy = sys.modules["numpy"]
+    xs = numpy.asarray(xs).ravel().astype(numpy.int64)
+    ys = numpy.asarray(ys).ravel().astype(numpy.int64)
+    colors = numpy.asarray(colors).astype(numpy.int64)
+    if len(xs) != len(ys):
+        raise ValueError(f"xs and ys must have the same length, {len(xs)} != {len(ys)}")
+
+    single_color = colors.shape == (3,)
+    if not single_color and colors.shape != (len(xs), 3):
+        raise ValueError(f"colors must be a single color or have the same length as xs, {len(colors)} != {len(xs)}")
+
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    xs, ys = xs + offset_x, ys + offset_y
+    visible = (xs >= clip_x0) & (xs < clip_x1) & (ys >= clip_y0) & (ys < clip_y1)
+
+    if _settings["debuging_messages"]:
+        for x, y in zip((xs[~visible] - offset_x).tolist(), (ys[~visible] - offset_y).tolist()):
+            _debuging_coordinates(x, y, "set_pixels")
+        for color in (colors.reshape(-1, 3)[:1] if single_color else colors).tolist():
+            _debuging_color(tuple(color), "set_pixels")
+
+    valid = ((colors >= 0) & (colors <= 255)).all(axis=-1)  # invalid colors are ignored, like set_pixel does
+    if single_color:
+        if not valid:
+            return
+    else:
+        visible &= valid
+        colors = colors[visible]
+    xs, ys = xs[visible], ys[visible]
+    if len(xs) == 0:
+        return
+
+    indices = ys * _width + xs
+    if _rgb565:
+        values = (colors[..., 0] >> 3) << 11 | (colors[..., 1] >> 2) << 5 | colors[..., 2] >> 3
+        numpy.frombuffer(_framebuffer, dtype="<u2")[indices] = values
+    else:
+        if _settings["correct_colors"] is True:
+            colors = colors & (0xF8, 0xFC, 0xF8)
+        numpy.frombuffer(_framebuffer, dtype=numpy.uint8).reshape(-1, 3)[indices] = colors
+
+    _dirty_pixels[:] = (
+        min(_dirty_pixels[0], int(xs.min())),
+        min(_dirty_pixels[1], int(ys.min())),
+        max(_dirty_pixels[2], int(xs.max()) + 1),
+        max(_dirty_pixels[3], int(ys.max()) + 1),
+    )
+
+
+def _native_color(color: Color) -> bytes:
+    """Converts a color to the pixel format of the framebuffer
+
+    The color is corrected if the setting ``correct_colors`` is True
+
+    :param color: The color
+    :return: The bytes of a single pixel, 2 bytes in RGB565 mode, 3 otherwise
+    :raise ValueError: Raise a :py:exc:`ValueError` if the color is invalid
+    """
+    if _rgb565:
+        return _color_to_rgb565(color).to_bytes(2, "little")
+
+    try:  # the color must have exactly three channels, or the pixel wouldn't have 3 bytes
+        red, green, blue = color
+        if _settings["correct_colors"] is True:
+            red, green, blue = red - red % 8, green - green % 4, blue - blue % 8
+        return bytes((red, green, blue))
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid color {color}") from None
+
+
+def _native_pixels(pixels: bytes) -> bytes:
+    """Converts RGB pixels to the pixel format of the framebuffer
+
+    The colors are corrected if the setting ``correct_colors`` is True
+
+    :param pixels: The pixels, 3 bytes (red, green, blue) per pixel
+    :return: The pixels in the format of the framebuffer
+    """
+    if _rgb565:
+        return _rgb_to_rgb565(pixels)
+    if _settings["correct_colors"] is True:
+        return _correct_colors_bytes(pixels)
+    return pixels
+
+
+def _convert_sprite(image, transparent: Color | None, width: int | None) -> _Sprite:
+    """Converts an image to the format used by :py:func:`draw_image`
+
+    The rows are split in runs of opaque pixels, already converted to the format of the framebuffer.
+
+    :param image: A PIL image, a list of rows of colors or a buffer with 3 bytes (red, green, blue) per pixel
+    :param transparent: The color of the transparent pixels, or None
+    :param width: The width of the image, only used if the image is a buffer
+    :return: The converted sprite
+    :raise ValueError: Raise a :py:exc:`ValueError` if the image can't be converted
+    """
+    if isinstance(image, Image.Image):
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            rgba = image.convert("RGBA")
+            alpha = rgba.getchannel("A").tobytes()
+            opaque_rows = [
+                [value >= 128 for value in alpha[y * rgba.width:(y + 1) * rgba.width]]
+                for y in range(rgba.height)
+            ]
+        else:
+            opaque_rows = None
+        width, height = image.size
+        pixels = image.convert("RGB").tobytes()
+    elif isinstance(image, (list, tuple)):
+        height = len(image)
+        width = max((len(row) for row in image), default=0)
+        pixels = bytearray(width * height * 3)
+        opaque_rows = []
+        for y, row in enumerate(image):
+            opaque_rows.append([color is not None for color in row] + [False] * (width - len(row)))
+            for x, color in enumerate(row):
+                if color is not None:
+                    try:  # a slice of another length would resize the pixels
+                        red, green, blue = color
+                        pixels[(y * width + x) * 3:(y * width + x + 1) * 3] = (red, green, blue)
+                    except (TypeError, ValueError):
+                        raise ValueError(f"Invalid color {color} at ({x}, {y})") from None
+    else:
+        pixels = memoryview(image).cast("B")
+        if width is None or width <= 0 or len(pixels) % (width * 3) != 0:
+            raise ValueError("The width of a buffer sprite must be given and divide its number of pixels")
+        height = len(pixels) // (width * 3)
+        opaque_rows = None
+
+    key = bytes(transparent) if transparent is not None else None
+    rows: list[list[tuple[int, bytes]]] = []
+    for y in range(height):
+        row = pixels[y * width * 3:(y + 1) * width * 3]
+        opaque = opaque_rows[y] if opaque_rows is not None else [True] * width
+        if key is not None:
+            opaque = [is_opaque and row[x * 3:x * 3 + 3] != key for x, is_opaque in enumerate(opaque)]
+
+        runs = []
+        x = 0
+        while x < width:  # splits the row in runs of opaque pixels
+            if not opaque[x]:
+                x += 1
+                continue
+            start = x
+            while x < width and opaque[x]:
+                x += 1
+            runs.append((start, bytes(_native_pixels(row[start * 3:x * 3]))))
+        rows.append(runs)
+
+    return width, height, rows
+
+
+def _render_string(text: str, size: Text_size, scale: int = 1, bold: bool = False) -> _TextMask:
+    """Renders a string into a mask, the bitmasks of the characters are placed side by side
+
+    :param text: The string
+    :param size: The size of the characters
+    :param scale: The scale of the characters
+    :param bold: If the characters are bold
+    :return: The mask of the string
+    :raise ValueError: Raise a :py:exc:`ValueError` if a character is not implemented for the size
+    """
+    row_masks: list[int] = []
+    width = 0
+    for char in text:
+        char_width, height, masks = _get_glyph(char, size, scale, bold)
+        row_masks += [0] * (height - len(row_masks))
+        for row, mask in enumerate(masks):
+            row_masks[row] |= mask << width
+        width += char_width
+
+    return _masks_to_text_mask(row_masks, width)
+
+
+def _masks_to_text_mask(row_masks: list[int], width: int) -> _TextMask:
+    """Converts the bitmasks of the rows of a text into a mask with the size of a pixel of the framebuffer
+
+    :param row_masks: A bitmask for every row, the bit ``x`` is set if the pixel ``x`` is drawn
+    :param width: The width of the text, the bits after it are ignored
+    :return: The mask of the text
+    """
+    row_size = (width + 7) // 8
+    bits = b"".join(
+        b"".join(_BITS_TO_MASK[value] for value in mask.to_bytes(row_size, "little"))[:width]
+        for mask in row_masks
+    )
+    mask = bytearray(len(bits) * _bytes_per_pixel)
+    for offset in range(_bytes_per_pixel):  # every byte of a pixel has the same mask
+        mask[offset::_bytes_per_pixel] = bits
+    return width, len(row_masks), bytes(mask)
+
+
+def _check_scale(scale: int) -> None:
+    """Checks that the scale of a text is a positive integer
+
+    :raise ValueError: Raise a :py:exc:`ValueError` if the scale isn't a positive integer
+    """
+    if not isinstance(scale, int) or scale < 1:
+        raise ValueError(f"The scale must be a positive integer, scale = {scale}")
+
+
+def _layout_text(text: str, size: Text_size, width: int) -> list[str]:
+    """Splits a text into lines that fit in the given width
+
+    The lines are split at the newlines and the words are wrapped at the spaces, the spaces where a line is wrapped
+    aren't drawn. The words wider than the box are cut between two characters.
+    The widths come from the advance table of the size, see :py:func:`casioplot.characters._get_metrics`.
+
+    :param text: The text
+    :param size: The size of the characters
+    :param width: The width of the box
+    :return: The lines
+    :raise ValueError: Raise a :py:exc:`ValueError` if a character is not implemented for the size
+    """
+    advances, _ = _get_metrics(size)
+    try:
+        space_width = advances[" "]
+        lines = []
+        for paragraph in text.split("\n"):
+            first_line = len(lines)
+            line, line_width = None, 0
+            wrapped = False
+            for word in paragraph.split(" "):  # consecutive spaces give empty words
+                word_width = sum(map(advances.__getitem__, word))
+                if line is not None:
+                    if line_width + space_width + word_width <= width:
+                        line, line_width = f"{line} {word}", line_width + space_width + word_width
+                        continue
+                    if line.strip(" "):  # a line of spaces is dropped, the word starts the line instead
+                        lines.append(line.rstrip(" "))
+                    line, wrapped = None, True
+                if wrapped and not word:  # the spaces at the start of a wrapped line aren't drawn
+                    continue
+
+                while word_width > width and len(word) > 1:  # the word doesn't fit in a line
+                    end, part_width = 0, 0
+                    while part_width + advances[word[end]] <= width:
+                        part_width += advances[word[end]]
+                        end += 1
+                    end = max(end, 1)  # a character wider than the box still gets its own line
+                    lines.append(word[:end])
+                    word = word[end:]
+                    word_width = sum(map(advances.__getitem__, word))
+                line, line_width = word, word_width
+            if line is not None:
+                lines.append(line)
+            elif len(lines) == first_line:  # the paragraph only has spaces
+                lines.append("")
+    except KeyError as error:
+        raise ValueError(f"Character '{error.args[0]}' not implemented for size {size}") from None
+    return lines
+
+
+def _render_text_box(text: str, size: Text_size, width: int, height: int) -> _TextMask:
+    """Renders a text laid out by :py:func:`_layout_text` into a single mask
+
+    :param text: The text
+    :param size: The size of the characters
+    :param width: The width of the box
+    :param height: The height of the box, the lines after the last complete line that fits are ignored
+    :return: The mask of the whole box
+    :raise ValueError: Raise a :py:exc:`ValueError` if a character is not implemented for the size
+    """
+    advances, line_height = _get_metrics(size)
+    lines = _layout_text(text, size, width)[:height // line_height] if line_height else []
+
+    row_masks = [0] * (len(lines) * line_height)
+    text_width = 0
+    for line_number, line in enumerate(lines):
+        top = line_number * line_height
+        x = 0
+        for char in line:
+            char_width, _, masks = _get_glyph(char, size)
+            for row, mask in enumerate(masks, top):
+                row_masks[row] |= mask << x
+            x += char_width
+        text_width = max(text_width, x)
+
+    return _masks_to_text_mask(row_masks, min(text_width, width))
+
+
+def _draw_text_mask(x: int, y: int, text_mask: _TextMask, pixel: bytes) -> None:
+    """Draws a rendered string with its top left corner at the given coordinates
+
+    The visible part of the string is placed over the framebuffer at once, with its mask,
+    so the pixels of every row are only written once.
+
+    :param x: x coordinate of the top left corner (from the left)
+    :param y: y coordinate of the top left corner (from the top)
+    :param text_mask: The string, see :py:func:`_render_string`
+    :param pixel: The bytes of the pixel, see :py:func:`_native_color`
+    """
+    width, height, mask = text_mask
+
+    # clips the string once
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x, y = x + offset_x, y + offset_y
+    x0, y0 = max(x, clip_x0), max(y, clip_y0)
+    x1, y1 = min(x + width, clip_x1), min(y + height, clip_y1)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    region = (x0, y0, x1, y1)
+    visible_mask = _region_bytes(mask, width, (x0 - x, y0 - y, x1 - x, y1 - y), _bytes_per_pixel)
+    pixels = _composite_bytes(
+        _region_bytes(_framebuffer, _width, region, _bytes_per_pixel),
+        pixel * ((x1 - x0) * (y1 - y0)),
+        visible_mask
+    )
+    _write_region(_framebuffer, _bytes_per_pixel, region, pixels)
+    _mark_dirty(x0, y0, x1, y1)
+
+
+def _cache_string(key: tuple, text_mask: _TextMask) -> None:
+    """Adds a string to :py:data:`_string_cache`, the least recently used strings are forgotten if needed
+
+    :param key: The key of the string, see :py:data:`_string_cache`
+    :param text_mask: The rendered string
+    """
+    budget = _settings["text_cache_size"]
+    if len(text_mask[2]) > budget:
+        return
+
+    _string_cache[key] = text_mask
+    _string_cache_stats["memory"] += len(text_mask[2])
+    while _string_cache_stats["memory"] > budget:
+        oldest = next(iter(_string_cache))
+        _string_cache_stats["memory"] -= len(_string_cache.pop(oldest)[2])
+
+
+def _write_region(framebuffer: bytearray, bytes_per_pixel: int, region: Rect, pixels: bytes) -> None:
+    """Writes the pixels of a region of a framebuffer, the opposite of :py:func:`casioplot.backends._region_bytes`
+
+    :param framebuffer: The framebuffer
+    :param bytes_per_pixel: The number of bytes of a pixel of the framebuffer
+    :param region: The region, inside the canvas
+    :param pixels: The pixels of the region, row after row
+    """
+    x0, y0, x1, y1 = region
+    row_stride = _width * bytes_per_pixel
+    if x0 == 0 and x1 == _width:  # full rows are contiguous in memory
+        framebuffer[y0 * row_stride:y1 * row_stride] = pixels
+        return
+
+    pixels = memoryview(pixels)
+    row_size = (x1 - x0) * bytes_per_pixel
+    index = (y0 * _width + x0) * bytes_per_pixel
+    for start in range(0, len(pixels), row_size):
+        framebuffer[index:index + row_size] = pixels[start:start + row_size]
+        index += row_stride
+
+
+def _flip(rects: list[Rect]) -> None:
+    """Copies the given regions of the canvas to the front buffer :py:data:`_front_buffer`
+
+    The layers above the canvas are placed over it and the RGB565 pixels are converted to RGB during the copy.
+    Every region is converted at once, and written with a single slice assignment when it covers full rows.
+
+    :param rects: The regions to copy
+    """
+    for rect in rects:
+        x0, y0, x1, y1 = rect
+        pixels = _region_bytes(_canvas_framebuffer, _width, rect, _bytes_per_pixel)
+        if _overlay is not None:
+            overlay_pixels, overlay_mask = _overlay
+            pixels = _composite_bytes(
+                pixels,
+                _region_bytes(overlay_pixels, _width, rect, _bytes_per_pixel),
+                _region_bytes(overlay_mask, _width, rect, _bytes_per_pixel)
+            )
+        if _rgb565:
+            pixels = _rgb565_to_rgb(pixels)
+        _write_region(_front_buffer, 3, rect, pixels)
+
+
+def _composite_layers(layers: list[_Layer], pixels: bytes, mask: bytes) -> tuple[bool, bytes, bytes]:
+    """Composites layers from the bottom to the top
+
+    Every layer keeps the composite up to itself, so only the layers from the first changed one are composited.
+
+    :param layers: The layers, sorted from the bottom to the top
+    :param pixels: The pixels below the layers
+    :param mask: The mask of ``pixels``
+    :return: If a layer changed, the composite of the layers and its mask
+    """
+    changed = False
+    for layer in layers:
+        if changed or layer.dirty:
+            changed = True
+            layer_mask = layer.opaque_mask()
+            layer.pixels = pixels = bytearray(_composite_bytes(pixels, layer.framebuffer, layer_mask))
+            layer.mask = mask = bytearray(_or_bytes(mask, layer_mask))
+            layer.dirty = False
+        else:
+            pixels, mask = layer.pixels, layer.mask
+    return changed, pixels, mask
+
+
+def _composite_region(layers: list[_Layer], region: Rect, pixels: bytes, mask: bytes) -> None:
+    """Composites a region of layers from the bottom to the top, the composite of every layer is updated
+
+    :param layers: The layers, sorted from the bottom to the top, already composited once
+    :param region: The region
+    :param pixels: The pixels of the region below the layers
+    :param mask: The mask of ``pixels``
+    """
+    for layer in layers:
+        layer_pixels = _region_bytes(layer.framebuffer, _width, region, _bytes_per_pixel)
+        layer_mask = layer.opaque_mask(layer_pixels)
+        pixels = _composite_bytes(pixels, layer_pixels, layer_mask)
+        mask = _or_bytes(mask, layer_mask)
+        _write_region(layer.pixels, _bytes_per_pixel, region, pixels)
+        _write_region(layer.mask, _bytes_per_pixel, region, mask)
+
+
+def _update_layers() -> None:
+    """Composites the changed layers
+
+    The layers below the canvas become :py:data:`_canvas_blank`, restored by :py:func:`clear_screen`.
+    The layers above the canvas become :py:data:`_overlay`, placed over the canvas by :py:func:`_flip`,
+    so the regions where they change are marked as changed.
+    If only some regions of the layers were drawn on (see :py:attr:`_Layer.changed`), only they are composited.
+    """
+    global _canvas_blank, _overlay
+    _take_layer_pixels()
+    if not any(layer.dirty or layer.changed for layer in _layers.values()):
+        return
+
+    layers = sorted(_layers.values(), key=lambda layer: layer.z)
+    for below, side in ((True, [layer for layer in layers if layer.z < 0]),
+                        (False, [layer for layer in layers if layer.z > 0])):
+        if not side:
+            continue
+
+        if below:
+            base_pixels, base_mask = _blank_framebuffer, b"\xff" * len(_blank_framebuffer)
+        else:
+            base_pixels = base_mask = bytes(len(_blank_framebuffer))
+
+        if any(layer.dirty for layer in side):
+            for layer in side:  # the composite of the layers drawn on is out of date too
+                layer.dirty = layer.dirty or bool(layer.changed)
+            _composite_layers(side, base_pixels, base_mask)
+            regions = [(0, 0, _width, _height)]
+        else:
+            regions = _merge_rects([region for layer in side for region in layer.changed])
+            for region in regions:
+                _composite_region(
+                    side,
+                    region,
+                    _region_bytes(base_pixels, _width, region, _bytes_per_pixel),
+                    _region_bytes(base_mask, _width, region, _bytes_per_pixel)
+                )
+        for layer in side:
+            layer.changed.clear()
+
+        if below:
+            _canvas_blank = side[-1].pixels
+        elif regions:
+            _overlay = (side[-1].pixels, side[-1].mask)
+            _dirty_rects.extend(regions)  # not _mark_dirty, it would mark the selected layer again
+
+
+def _fill_rect_clipped(x0: int, y0: int, x1: int, y1: int, pixel: bytes) -> None:
+    """Fills a rectangle of the framebuffer with a pixel and marks it as changed
+
+    The rectangle must already be clipped to the canvas, every row is written with a single slice assignment.
+
+    :param pixel: The bytes of the pixel, see :py:func:`_native_color`
+    """
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    size = _bytes_per_pixel
+    if x0 == 0 and x1 == _width:  # full rows are contiguous in memory
+        _framebuffer[y0 * _width * size:y1 * _width * size] = pixel * ((y1 - y0) * _width)
+    else:
+        row = pixel * (x1 - x0)
+        row_size = len(row)
+        row_stride = _width * size
+        index = (y0 * _width + x0) * size
+        for _ in range(y1 - y0):
+            _framebuffer[index:index + row_size] = row
+            index += row_stride
+
+    _mark_dirty(x0, y0, x1, y1)
+
+
+def _fill_rect(x: int, y: int, width: int, height: int, color: Color, function: str) -> None:
+    """Clips a rectangle and fills it with a color, used by :py:func:`fill_rect` and :py:func:`hline`
+
+    :param function: The function that called this function, used by the debuging messages
+    """
+    if _settings["debuging_messages"]:
+        _debuging_color(color, function)
+
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x, y = x + offset_x, y + offset_y
+    x0, y0 = max(x, clip_x0), max(y, clip_y0)
+    x1, y1 = min(x + width, clip_x1), min(y + height, clip_y1)
+    if x0 >= x1 or y0 >= y1:  # the rectangle is out of the canvas
+        if _settings["debuging_messages"]:
+            _debuging_coordinates(x, y, function)
+        return
+
+    try:
+        _fill_rect_clipped(x0, y0, x1, y1, _native_color(color))
+    except ValueError:  # invalid colors are ignored, like set_pixel does
+        pass
+
+
+def _move_pixels(framebuffer: bytearray, bytes_per_pixel: int, region: Rect, x: int, y: int) -> None:
+    """Copies a region of a framebuffer to another position in the same framebuffer
+
+    Both positions must be inside the canvas, they can overlap.
+    Full rows are moved with a single slice assignment, otherwise the region is copied once and written row by row.
+
+    :param framebuffer: The framebuffer, the back buffer or the front buffer
+    :param bytes_per_pixel: The number of bytes of a pixel of the framebuffer
+    :param region: The region to copy
+    :param x: x coordinate of the new position of the region
+    :param y: y coordinate of the new position of the region
+    """
+    x0, y0, x1, y1 = region
+    _write_region(
+        framebuffer, bytes_per_pixel, (x, y, x + x1 - x0, y + y1 - y0),
+        _region_bytes(framebuffer, _width, region, bytes_per_pixel)
+    )
+
+
+def _copy_rect_clipped(region: Rect, x: int, y: int) -> None:
+    """Copies a region of the framebuffer to another position and marks the changes
+
+    Both positions must already be clipped. When the canvas is selected and there isn't any layer above it,
+    the copy is also done on the front buffer and by the backend at the next :py:func:`show_screen`,
+    so only the changed pixels that were moved need to be sent again, not the whole region.
+
+    :param region: The region to copy
+    :param x: x coordinate of the new position of the region
+    :param y: y coordinate of the new position of the region
+    """
+    x0, y0, x1, y1 = region
+    _move_pixels(_framebuffer, _bytes_per_pixel, region, x, y)
+
+    if _framebuffer is not _canvas_framebuffer or _overlay is not None:
+        _mark_dirty(x, y, x + x1 - x0, y + y1 - y0)
+        return
+
+    # the changed pixels that were moved are still changed at their new position
+    pixels_x0, pixels_y0, pixels_x1, pixels_y1 = _dirty_pixels
+    if pixels_x0 < pixels_x1:
+        _dirty_rects.append((pixels_x0, pixels_y0, pixels_x1, pixels_y1))
+        _dirty_pixels[:] = _NO_DIRTY_PIXELS
+    dx, dy = x - x0, y - y0
+    for rect_x0, rect_y0, rect_x1, rect_y1 in _merge_rects(_dirty_rects):
+        moved_x0, moved_y0 = max(rect_x0, x0) + dx, max(rect_y0, y0) + dy
+        moved_x1, moved_y1 = min(rect_x1, x1) + dx, min(rect_y1, y1) + dy
+        _mark_dirty(moved_x0, moved_y0, moved_x1, moved_y1)
+
+    _pending_copies.append((region, x, y))
+
+
+def _draw_spans(spans: Iterable[Span], pixel: bytes) -> None:
+    """Fills horizontal spans of the framebuffer with a pixel and marks them as changed
+
+    Every span is moved by the viewport offset, clipped to the clip rectangle (see :py:func:`push_clip`)
+    and written with a single slice assignment.
+    Used by the shapes, see :file:`shapes.py`
+
+    :param spans: The spans ``(y, x0, x1)``
+    :param pixel: The bytes of the pixel, see :py:func:`_native_color`
+    """
+    framebuffer, width, height, size = _framebuffer, _width, _height, _bytes_per_pixel
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    dirty_x0, dirty_y0, dirty_x1, dirty_y1 = width, height, 0, 0
+    for y, x0, x1 in spans:
+        y += offset_y
+        if not clip_y0 <= y < clip_y1:
+            continue
+        x0 += offset_x
+        x1 += offset_x
+        if x0 < clip_x0:
+            x0 = clip_x0
+        if x1 > clip_x1:
+            x1 = clip_x1
+        if x0 >= x1:
+            continue
+
+        index = (y * width + x0) * size
+        framebuffer[index:index + (x1 - x0) * size] = pixel * (x1 - x0)
+
+        if x0 < dirty_x0:
+            dirty_x0 = x0
+        if x1 > dirty_x1:
+            dirty_x1 = x1
+        if y < dirty_y0:
+            dirty_y0 = y
+        if y >= dirty_y1:
+            dirty_y1 = y + 1
+
+    _mark_dirty(dirty_x0, dirty_y0, dirty_x1, dirty_y1)
+
+
+def _draw_depth_spans(spans: Iterable[Span], pixel: bytes, plane: tuple[float, float, float]) -> None:
+    """Fills horizontal spans of the framebuffer with a pixel, only where they pass the depth test
+
+    The depth of every pixel comes from the plane ``depth = a * x + b * y + c`` evaluated at the center
+    of the pixel. A pixel is drawn only if it is closer (smaller depth) than the depth stored in
+    :py:data:`_depth_buffer`, which is then updated. The drawn pixels are written in runs.
+    The spans are moved and clipped like :py:func:`_draw_spans` does.
+
+    :param spans: The spans ``(y, x0, x1)``
+    :param pixel: The bytes of the pixel, see :py:func:`_native_color`
+    :param plane: The coefficients ``(a, b, c)`` of the plane
+    """
+    global _depth_buffer
+    if _depth_buffer is None:  # created when it is used for the first time
+        _depth_buffer = array("d", [inf]) * (_width * _height)
+
+    framebuffer, depths, width, height, size = _framebuffer, _depth_buffer, _width, _height, _bytes_per_pixel
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    a, b, c = plane
+    dirty_x0, dirty_y0, dirty_x1, dirty_y1 = width, height, 0, 0
+    for y, x0, x1 in spans:
+        y += offset_y
+        if not clip_y0 <= y < clip_y1:
+            continue
+        x0 += offset_x
+        x1 += offset_x
+        if x0 < clip_x0:
+            x0 = clip_x0
+        if x1 > clip_x1:
+            x1 = clip_x1
+        if x0 >= x1:
+            continue
+
+        depth = a * (x0 - offset_x + 0.5) + b * (y - offset_y + 0.5) + c  # the plane uses the user coordinates
+        row = y * width
+        run_start = -1
+        for x in range(x0, x1 + 1):
+            if x < x1 and depth < depths[row + x]:
+                depths[row + x] = depth
+                if run_start < 0:
+                    run_start = x
+            elif run_start >= 0:  # the run of visible pixels ends here
+                index = (row + run_start) * size
+                framebuffer[index:index + (x - run_start) * size] = pixel * (x - run_start)
+                if run_start < dirty_x0:
+                    dirty_x0 = run_start
+                if x > dirty_x1:
+                    dirty_x1 = x
+                if y < dirty_y0:
+                    dirty_y0 = y
+                if y >= dirty_y1:
+                    dirty_y1 = y + 1
+                run_start = -1
+            depth += a
+
+    _mark_dirty(dirty_x0, dirty_y0, dirty_x1, dirty_y1)
+
+
+def _blend_pixels(pixels: Iterable[tuple[int, int, float]], color: Color) -> None:
+    """Blends a color over pixels of the framebuffer, with a coverage for every pixel
+
+    Used by the anti-aliased shapes, the blending is done directly in the framebuffer.
+    The pixels are moved and clipped like :py:func:`_draw_spans` does.
+
+    :param pixels: The pixels ``(x, y, coverage)``, the coverage goes from 0 (transparent) to 1 (opaque)
+    :param color: The color blended over the pixels
+    """
+    framebuffer, width, height, size = _framebuffer, _width, _height, _bytes_per_pixel
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    red, green, blue = color
+    correct_colors = _settings["correct_colors"] is True
+    dirty_x0, dirty_y0, dirty_x1, dirty_y1 = width, height, 0, 0
+    for x, y, coverage in pixels:
+        x += offset_x
+        y += offset_y
+        if not (clip_x0 <= x < clip_x1 and clip_y0 <= y < clip_y1) or coverage <= 0:
+            continue
+        if coverage > 1:
+            coverage = 1
+
+        index = (y * width + x) * size
+        if _rgb565:
+            background = _rgb565_to_color(framebuffer[index] | framebuffer[index + 1] << 8)
+        else:
+            background = framebuffer[index], framebuffer[index + 1], framebuffer[index + 2]
+
+        mixed = (
+            int(background[0] + (red - background[0]) * coverage),
+            int(background[1] + (green - background[1]) * coverage),
+            int(background[2] + (blue - background[2]) * coverage)
+        )
+        if _rgb565:
+            value = _RED_TO_565[mixed[0]] | _GREEN_TO_565[mixed[1]] | _BLUE_TO_565[mixed[2]]
+            framebuffer[index] = value & 0xFF
+            framebuffer[index + 1] = value >> 8
+        else:
+            if correct_colors:
+                mixed = (mixed[0] - mixed[0] % 8, mixed[1] - mixed[1] % 4, mixed[2] - mixed[2] % 8)
+            framebuffer[index:index + 3] = bytes(mixed)
+
+        if x < dirty_x0:
+            dirty_x0 = x
+        if x >= dirty_x1:
+            dirty_x1 = x + 1
+        if y < dirty_y0:
+            dirty_y0 = y
+        if y >= dirty_y1:
+            dirty_y1 = y + 1
+
+    _mark_dirty(dirty_x0, dirty_y0, dirty_x1, dirty_y1)
+
+
+def _visible_rows() -> tuple[int, int]:
+    """Gets the rows inside the clip rectangle, in the coordinates used by the drawing functions
+
+    :return: The first visible row and the row after the last one
+    """
+    return _viewport[3] - _viewport[1], _viewport[5] - _viewport[1]
+
+
+def _mark_dirty(x0: int, y0: int, x1: int, y1: int) -> None:
+    """Marks a region of the canvas as changed, so :py:func:`show_screen` sends it to the backend
+
+    The region must already be clipped to the canvas.
+    Single pixels set by :py:func:`set_pixel` are tracked apart, see :py:data:`_dirty_pixels`.
+    The region is also marked on the selected layer, see :py:attr:`_Layer.changed`.
+    """
+    if x0 < x1 and y0 < y1:
+        _dirty_rects.append((x0, y0, x1, y1))
+        if _current_layer is not None:
+            _layers[_current_layer].changed.append((x0, y0, x1, y1))
+
+
+def _take_layer_pixels() -> None:
+    """Marks the pixels set by :py:func:`set_pixel` on the selected layer as changed
+
+    They are only tracked by :py:data:`_dirty_pixels`, so they are added to the layer
+    before it is composited or another layer is selected.
+    """
+    x0, y0, x1, y1 = _dirty_pixels
+    if _current_layer is not None and x0 < x1:
+        _layers[_current_layer].changed.append((x0, y0, x1, y1))
+
+
+def _merge_rects(rects: list[Rect]) -> list[Rect]:
+    """Merges the overlapping rectangles into their bounding boxes
+
+    If the rectangles cover most of the canvas a single rectangle with the whole canvas is returned,
+    a single upload is faster than many small ones in that case.
+
+    :param rects: The rectangles to merge
+    :return: Rectangles that don't overlap
+    """
+    merged: list[Rect] = []
+    for rect in sorted(rects):
+        x0, y0, x1, y1 = rect
+        i = 0
+        while i < len(merged):  # absorbs every rectangle that overlaps the current one
+            mx0, my0, mx1, my1 = merged[i]
+            if x0 <= mx1 and mx0 <= x1 and y0 <= my1 and my0 <= y1:
+                x0, y0, x1, y1 = min(x0, mx0), min(y0, my0), max(x1, mx1), max(y1, my1)
+                merged.pop(i)
+                i = 0
+            else:
+                i += 1
+        merged.append((x0, y0, x1, y1))
+
+    area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in merged)
+    if area * 2 >= _width * _height:
+        return [(0, 0, _width, _height)]
+    return merged
+
+
+def _take_dirty_rects() -> list[Rect]:
+    """Gets the regions changed since the last call and resets the dirty tracking
+
+    :return: The changed regions, they don't overlap
+    """
+    global _dirty_rects
+    rects = _dirty_rects
+    _dirty_rects = []
+
+    x0, y0, x1, y1 = _dirty_pixels
+    if x0 < x1:
+        rects.append((x0, y0, x1, y1))
+        _dirty_pixels[:] = _NO_DIRTY_PIXELS
+
+    return _merge_rects(rects)
+
+
 def _save_screen(image_suffix: str = "") -> None:
     """Saves the virtual screen as an image
 
@@ -52,8 +981,8 @@ def _save_screen(image_suffix: str = "") -> None:
                          create images with the name :file:`casioplot2.png` for example
     """
 
-    canvas_image: Image.Image = ImageTk.getimage(_canvas)
-    background_image: Image.Image = ImageTk.getimage(_background)
+    canvas_image: Image.Image = _front_buffer_image()
+    background_image: Image.Image = _background.copy()
 
     background_image.paste(canvas_image, (_settings["left"], _settings["top"]))
 
@@ -112,23 +1041,83 @@ def _debuging_color(color: Color, function: str) -> None:
         print(f"    - the blue channel must be smaller or equal to 255, blue = {color[2]}")
 
 
+def _present() -> None:
+    """Composites the layers, flips the changed regions to the front buffer and sends them to the backend"""
+    # page flip, the drawing functions only write to the back buffer and the backend only reads the front buffer,
+    # so a frame is never shown half drawn
+    _update_layers()
+    for region, x, y in _pending_copies:  # the copies are replayed on the screen before the changed regions
+        _move_pixels(_front_buffer, 3, region, x, y)
+        _backend.copy(region, x, y)
+    _pending_copies.clear()
+
+    dirty_rects = _take_dirty_rects()
+    _flip(dirty_rects)
+    _backend.present(_front_buffer, dirty_rects)
+
+
 # functions for the user
 
 
+def _pace_frame() -> bool:
+    """Waits for the time of the next frame, used by :py:func:`show_screen` if the setting ``target_fps`` isn't 0
+
+    If the setting ``skip_frames`` is True and the program is suddenly late, a frame later than the last frame,
+    it doesn't wait and the frame is skipped.
+    A program that is always slower than ``target_fps`` isn't suddenly late, so its frames are all shown.
+    The next frame is one frame after this one, or one frame after now if the program is late,
+    so a slow frame doesn't make the next ones faster and a single skipped frame catches up.
+
+    :return: True if the frame must be shown, False if it is skipped
+    """
+    global _next_frame_time, _frame_lateness
+    period = 1 / _settings["target_fps"]
+    now = perf_counter()
+    if _next_frame_time is None:
+        _next_frame_time = now
+
+    lateness = max(now - _next_frame_time, 0.0)
+    skip = _settings["skip_frames"] and lateness > _frame_lateness + period
+    _frame_lateness = lateness
+    if skip:
+        _next_frame_time = now + period
+        return False
+
+    if now < _next_frame_time:
+        sleep(_next_frame_time - now)
+    _frame_stats["sleep_time"] = max(_next_frame_time - now, 0.0)
+    _next_frame_time = max(_next_frame_time, now) + period
+    return True
+
+
 def show_screen() -> None:
     """Shows or saves the virtual screen
 
     This function implement two distinct modes:
 
-      - show the virtual screen in real time in a tkinter window, if ``show_screen`` is True
+      - show the virtual screen with the backend, a tkinter window if ``show_screen`` is True
       - Save the virtual screen to the disk, if ``save_screen`` in True
 
     These modes are independent and can work at the same time
-    """
 
-    if _settings["show_screen"] is True:
-        # the virtual screen is already updated, the tkinter window just needs to update what it is showing
-        _window.update()
+    If the setting ``target_fps`` isn't 0, it waits so the frames are shown at this rate,
+    and with the setting ``skip_frames`` the frames are skipped (not shown nor saved) when the program is late,
+    see :py:func:`frame_info`.
+    """
+    global _frame_end_time
+    start = perf_counter()
+    if _settings["target_fps"] and not _pace_frame():
+        _frame_stats["skipped"] += 1
+        return  # the changes are kept and shown by the next frame
+    _frame_stats["work_time"] = start - _frame_end_time
+
+    present_start = perf_counter()
+    _present()
+    end = perf_counter()
+    _frame_stats["present_time"] = end - present_start
+    _frame_stats["frame_time"] = end - _frame_end_time
+    _frame_stats["frames"] += 1
+    _frame_end_time = end
 
     if _settings["save_screen"] is True and _settings["save_multiple"] is True:
         global _save_screen_counter, _current_image_number
@@ -140,35 +1129,143 @@ def show_screen() -> None:
             _save_screen_counter += 1
 
 
-def clear_screen() -> None:
-    """Clear the canvas, sets every pixel to white"""
-    _canvas.put(
-        "white",
-        to=(0, 0, _settings["width"], _settings["height"])
-    )
+def frame_info() -> dict[str, float]:
+    """Get the timing of the frames shown by :py:func:`show_screen`
+
+    The times are in seconds and are those of the last frame that was shown.
+
+    :return: A dictionary with the number of ``"frames"`` shown and ``"skipped"``,
+             the ``"frame_time"`` between the two last frames, the ``"work_time"`` spent drawing before the last frame,
+             the ``"sleep_time"`` waited to respect the setting ``target_fps``
+             and the ``"present_time"`` spent showing the last frame
+    """
+    return dict(_frame_stats)
+
+
+def clear_screen(color: Color = _WHITE) -> None:
+    """Clear the canvas, sets every pixel to white or to the given color
+
+    Only the back buffer is reset, the screen shows the previous frame until :py:func:`show_screen` is called.
+
+    If there are layers below the canvas, clearing it to white shows their cached composite instead,
+    see :py:func:`create_layer`. Clearing a layer to white makes it transparent if it has a transparent color.
+    The clip rectangle isn't used, the whole canvas is cleared.
+
+    :param color: The color of the canvas after clearing it
+    """
+    clear_depth_buffer()
+
+    if color == _WHITE:
+        if _current_layer is None:
+            _update_layers()
+            _framebuffer[:] = _canvas_blank
+        else:
+            _framebuffer[:] = _layers[_current_layer].blank
+        _mark_dirty(0, 0, _width, _height)
+        return
+
+    if _settings["debuging_messages"]:
+        _debuging_color(color, "clear_screen")
+    try:
+        _fill_rect_clipped(0, 0, _width, _height, _native_color(color))
+    except ValueError:  # invalid colors are ignored, like set_pixel does
+        pass
+
+
+def clear_depth_buffer() -> None:
+    """Reset the depth buffer used by the 3D functions, every pixel becomes infinitely far
+
+    :py:func:`clear_screen` also resets it.
+    """
+    global _depth_buffer
+    _depth_buffer = None  # it is created again, already cleared, when it is needed
+
+
+def fill_rect(x: int, y: int, width: int, height: int, color: Color = _BLACK) -> None:
+    """Fill a rectangle with the given RGB color
+
+    The rectangle is clipped once and every row is written in a single operation,
+    it is much faster than calling :py:func:`set_pixel` for every pixel.
+
+    :param x: x coordinate of the top left corner (from the left)
+    :param y: y coordinate of the top left corner (from the top)
+    :param width: Width of the rectangle in pixels
+    :param height: Height of the rectangle in pixels
+    :param color: The color of the rectangle
+    """
+    _fill_rect(x, y, width, height, color, "fill_rect")
+
+
+def hline(x: int, y: int, length: int, color: Color = _BLACK) -> None:
+    """Draw a horizontal line, from (x, y) to the right
+
+    :param x: x coordinate of the first pixel (from the left)
+    :param y: y coordinate of the line (from the top)
+    :param length: Number of pixels of the line
+    :param color: The color of the line
+    """
+    _fill_rect(x, y, length, 1, color, "hline")
+
+
+def vline(x: int, y: int, length: int, color: Color = _BLACK) -> None:
+    """Draw a vertical line, from (x, y) to the bottom
+
+    :param x: x coordinate of the line (from the left)
+    :param y: y coordinate of the first pixel (from the top)
+    :param length: Number of pixels of the line
+    :param color: The color of the line
+    """
+    if _settings["debuging_messages"]:
+        _debuging_color(color, "vline")
+
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x, y = x + offset_x, y + offset_y
+    y0, y1 = max(y, clip_y0), min(y + length, clip_y1)
+    if not (clip_x0 <= x < clip_x1) or y0 >= y1:  # the line is out of the canvas
+        if _settings["debuging_messages"]:
+            _debuging_coordinates(x, y, "vline")
+        return
+
+    try:
+        pixel = _native_color(color)
+    except ValueError:  # invalid colors are ignored, like set_pixel does
+        return
+
+    # every byte of the pixel is written to the whole column with a single extended slice
+    size = _bytes_per_pixel
+    start = (y0 * _width + x) * size
+    end = (y1 * _width + x) * size
+    for offset, value in enumerate(pixel):
+        _framebuffer[start + offset:end:_width * size] = bytes((value,)) * (y1 - y0)
+
+    _mark_dirty(x, y0, x + 1, y1)
 
 
 def get_pixel(x: int, y: int) -> Color | None:
     """Get the RGB color of the pixel at the given coordinates of the canvas
 
-    Using a try statement is faster than checking if the coordinates are in bounds
-
     :param x: x coordinate (from the left)
     :param y: y coordinate (from the top)
     :return: The pixel color. A tuple that contain 3 integers from 0 to 255 or None if the pixel is out of the canvas
     """
-    try:
-        return _canvas.get(x, y)
-    except tk.TclError:  # the pixel is out of the canvas
-        if _settings["debuging_messages"]:
-            _debuging_coordinates(x, y, "get_pixel")
-        return None
+    x, y = x + _viewport[0], y + _viewport[1]
+    if 0 <= x < _width and 0 <= y < _height:
+        if _rgb565:
+            index = (y * _width + x) * 2
+            return _rgb565_to_color(_framebuffer[index] | _framebuffer[index + 1] << 8)
+
+        index = (y * _width + x) * 3
+        return _framebuffer[index], _framebuffer[index + 1], _framebuffer[index + 2]
+
+    if _settings["debuging_messages"]:
+        _debuging_coordinates(x, y, "get_pixel")
+    return None
 
 
 def set_pixel(x: int, y: int, color: Color = _BLACK) -> None:
     """Set the RGB color of the pixel at the given coordinates
 
-    Using a try statement is faster than checking if the coordinates are in bounds.
+    The pixel is only written to the framebuffer, the screen is updated by :py:func:`show_screen`.
 
     :param x: x coordinate (from the left)
     :param y: y coordinate (from the top)
@@ -177,22 +1274,317 @@ def set_pixel(x: int, y: int, color: Color = _BLACK) -> None:
     if _settings["debuging_messages"]:
         _debuging_color(color, "set_pixel")
 
-    try:
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x += offset_x
+    y += offset_y
+    if not (clip_x0 <= x < clip_x1 and clip_y0 <= y < clip_y1):  # the pixel is out of the canvas
+        if _settings["debuging_messages"]:
+            _debuging_coordinates(x, y, "set_pixel")
+        return
+
+    if _rgb565:  # the conversion to RGB565 is done with lookup tables
+        try:
+            value = _color_to_rgb565(color)
+        except ValueError:  # invalid colors are ignored, like tkinter used to do
+            return
+        index = (y * _width + x) * 2
+        _framebuffer[index] = value & 0xFF
+        _framebuffer[index + 1] = value >> 8
+    else:
+        try:  # a slice of another length would resize the framebuffer
+            red, green, blue = color
+        except (TypeError, ValueError):  # invalid colors are ignored, like tkinter used to do
+            return
+
         if _settings["correct_colors"] is True:  # corrects the colors to match the behavior of the casio calculators
-            color = (  # there may be a faster way
-                color[0] - color[0] % 8,
-                color[1] - color[1] % 4,
-                color[2] - color[2] % 8
-            )
+            red, green, blue = red - red % 8, green - green % 4, blue - blue % 8
 
-        _canvas.put(
-            "#%02x%02x%02x" % color,  # convert the color (RGB tuple) to a hexadecimal string '#RRGGBB'
-            to=(x, y)
-        )
-    except tk.TclError:  # the pixel is out of the canvas
+        index = (y * _width + x) * 3
+        try:
+            _framebuffer[index:index + 3] = (red, green, blue)
+        except (TypeError, ValueError):  # invalid colors are ignored, like tkinter used to do
+            return
+
+    # grows the bounding box of the pixels set since the last show_screen
+    dirty = _dirty_pixels
+    if x < dirty[0]:
+        dirty[0] = x
+    if y < dirty[1]:
+        dirty[1] = y
+    if x >= dirty[2]:
+        dirty[2] = x + 1
+    if y >= dirty[3]:
+        dirty[3] = y + 1
+
+
+def get_pixels(xs: Sequence[int], ys: Sequence[int]) -> list[Color | None]:
+    """Get the RGB colors of many pixels at once
+
+    Works like calling :py:func:`get_pixel` for every pair of coordinates but in a single call.
+    NumPy arrays can also be used for the coordinates.
+
+    :param xs: x coordinates (from the left)
+    :param ys: y coordinates (from the top)
+    :return: A list with the color of every pixel, the color is None if the pixel is out of the canvas
+    :raise ValueError: Raise a :py:exc:`ValueError` if ``xs`` and ``ys`` don't have the same length
+    """
+    xs, ys = _as_list(xs), _as_list(ys)
+    if len(xs) != len(ys):
+        raise ValueError(f"xs and ys must have the same length, {len(xs)} != {len(ys)}")
+
+    if _settings["debuging_messages"]:
+        for x, y in zip(xs, ys):
+            if not (0 <= x + _viewport[0] < _width and 0 <= y + _viewport[1] < _height):
+                _debuging_coordinates(x, y, "get_pixels")
+
+    framebuffer, width, height, rgb565 = _framebuffer, _width, _height, _rgb565
+    offset_x, offset_y = _viewport[0], _viewport[1]
+    colors: list[Color | None] = []
+    append = colors.append
+    for x, y in zip(xs, ys):
+        x += offset_x
+        y += offset_y
+        if not (0 <= x < width and 0 <= y < height):
+            append(None)
+        elif rgb565:
+            index = (y * width + x) * 2
+            append(_rgb565_to_color(framebuffer[index] | framebuffer[index + 1] << 8))
+        else:
+            index = (y * width + x) * 3
+            append((framebuffer[index], framebuffer[index + 1], framebuffer[index + 2]))
+    return colors
+
+
+def set_pixels(xs: Sequence[int], ys: Sequence[int], colors: Color | Sequence[Color] = _BLACK) -> None:
+    """Set the RGB colors of many pixels at once
+
+    Works like calling :py:func:`set_pixel` for every pair of coordinates, but the settings are read,
+    the single color is corrected and the dirty region is updated only once per call.
+    NumPy arrays can also be used for the coordinates and the colors, they are then written in a single pass
+    by NumPy, without a loop in python.
+
+    :param xs: x coordinates (from the left)
+    :param ys: y coordinates (from the top)
+    :param colors: A single color for every pixel or a color for each pixel
+    :raise ValueError: Raise a :py:exc:`ValueError` if the arguments don't have the same length
+    """
+    numpy = sys.modules.get("numpy")  # NumPy isn't imported by casioplot, arrays exist only if it was imported
+    if numpy is not None and any(isinstance(values, numpy.ndarray) for values in (xs, ys, colors)):
+        _set_pixels_array(xs, ys, colors)
+        return
+
+    xs, ys, colors = _as_list(xs), _as_list(ys), _as_list(colors)
+    if len(xs) != len(ys):
+        raise ValueError(f"xs and ys must have the same length, {len(xs)} != {len(ys)}")
+
+    single_color = len(colors) == 3 and not hasattr(colors[0], "__len__")
+    if not single_color and len(colors) != len(xs):
+        raise ValueError(f"colors must be a single color or have the same length as xs, {len(colors)} != {len(xs)}")
+
+    debuging = _settings["debuging_messages"]
+    correct_colors = _settings["correct_colors"] is True and not _rgb565
+
+    if debuging:
+        for x, y in zip(xs, ys):
+            if not (0 <= x + _viewport[0] < _width and 0 <= y + _viewport[1] < _height):
+                _debuging_coordinates(x, y, "set_pixels")
+        for color in ((colors,) if single_color else colors):
+            _debuging_color(color, "set_pixels")
+
+    to_pixel = None  # converts a color to the bytes of a pixel
+    if single_color:
+        try:  # the color only needs to be converted once
+            colors = repeat(_native_color(colors), len(xs))
+        except ValueError:  # invalid colors are ignored, like set_pixel does
+            return
+    elif _rgb565:
+        def to_pixel(color: Color) -> bytes:
+            value = _color_to_rgb565(color)
+            return bytes((value & 0xFF, value >> 8))
+    elif correct_colors:
+        def to_pixel(color: Color) -> Color:
+            red, green, blue = color
+            return red - red % 8, green - green % 4, blue - blue % 8
+    else:
+        def to_pixel(color: Color) -> Color:
+            red, green, blue = color  # a slice of another length would resize the framebuffer
+            return red, green, blue
+
+    framebuffer, width, size = _framebuffer, _width, _bytes_per_pixel
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x0, y0, x1, y1 = _dirty_pixels
+    for x, y, color in zip(xs, ys, colors):
+        x += offset_x
+        y += offset_y
+        if not (clip_x0 <= x < clip_x1 and clip_y0 <= y < clip_y1):
+            continue
+
+        index = (y * width + x) * size
+        try:
+            framebuffer[index:index + size] = color if to_pixel is None else to_pixel(color)
+        except (TypeError, ValueError, IndexError):  # invalid colors are ignored, like set_pixel does
+            continue
+
+        if x < x0:
+            x0 = x
+        if x >= x1:
+            x1 = x + 1
+        if y < y0:
+            y0 = y
+        if y >= y1:
+            y1 = y + 1
+
+    _dirty_pixels[:] = x0, y0, x1, y1
+
+
+def get_region(x: int, y: int, width: int, height: int, as_array: bool = False):
+    """Get the RGB colors of a rectangle of the canvas in a single call
+
+    By default the pixels are copied into a :py:class:`bytes` object, 3 bytes (red, green, blue) per pixel
+    and the rows one after the other, only one slice of the framebuffer is copied per row.
+
+    If ``as_array`` is True a read-only NumPy array with the shape ``(height, width, 3)`` is returned instead.
+    It is a view of the canvas, no pixel is copied, so it always shows the current content of the canvas.
+    Use :py:func:`set_region` to write the pixels back, it copies the view first.
+    In RGB565 mode the array has the shape ``(height, width)`` and contains the RGB565 values of the pixels,
+    :py:func:`set_region` also accepts it.
+
+    :param x: x coordinate of the top left corner (from the left)
+    :param y: y coordinate of the top left corner (from the top)
+    :param width: Width of the rectangle in pixels
+    :param height: Height of the rectangle in pixels
+    :param as_array: Return a NumPy view instead of a copy, needs NumPy to be installed
+    :return: The pixels of the rectangle
+    :raise ValueError: Raise a :py:exc:`ValueError` if the rectangle isn't fully inside the canvas
+    """
+    x, y = x + _viewport[0], y + _viewport[1]
+    if width <= 0 or height <= 0 or x < 0 or y < 0 or x + width > _width or y + height > _height:
+        raise ValueError(f"The region ({x}, {y}, {width}, {height}) must be inside the canvas "
+                         f"of size {_width}x{_height}")
+
+    if as_array:
+        import numpy  # optional dependency, only needed for this mode
+
+        if _rgb565:
+            array = numpy.frombuffer(_framebuffer, dtype="<u2").reshape(_height, _width)
+        else:
+            array = numpy.frombuffer(_framebuffer, dtype=numpy.uint8).reshape(_height, _width, 3)
+        view = array[y:y + height, x:x + width]
+        view.flags.writeable = False  # writes wouldn't be seen by show_screen
+        return view
+
+    pixels = _region_bytes(_framebuffer, _width, (x, y, x + width, y + height), _bytes_per_pixel)
+    if _rgb565:
+        return bytes(_rgb565_to_rgb(pixels))
+    return pixels
+
+
+def set_region(x: int, y: int, width: int, height: int, data) -> None:
+    """Set the RGB colors of a rectangle of the canvas in a single call
+
+    The pixels outside the canvas or the clip rectangle are ignored, like :py:func:`set_pixel` does.
+
+    :param x: x coordinate of the top left corner (from the left)
+    :param y: y coordinate of the top left corner (from the top)
+    :param width: Width of the rectangle in pixels
+    :param height: Height of the rectangle in pixels
+    :param data: The pixels, 3 bytes (red, green, blue) per pixel and the rows one after the other.
+                 Any object that supports the buffer protocol can be used,
+                 like the value returned by :py:func:`get_region` or a NumPy array of ``uint8``.
+                 In RGB565 mode an array of 2 bytes integers is written without conversion,
+                 like the array returned by :py:func:`get_region` with ``as_array``
+    :raise ValueError: Raise a :py:exc:`ValueError` if ``data`` doesn't have ``width * height * 3`` bytes
+                       (``width * height * 2`` for RGB565 pixels)
+    """
+    data = memoryview(data)
+    native = _rgb565 and data.itemsize == 2  # RGB565 pixels, they are already in the format of the framebuffer
+    data = data.cast("B") if data.c_contiguous else memoryview(data.tobytes())  # views of a region are copied
+    pixel_size = 2 if native else 3
+    if len(data) != width * height * pixel_size:
+        raise ValueError(f"data must have {width * height * pixel_size} bytes, not {len(data)}")
+
+    # clips the rectangle once, instead of checking every pixel
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x, y = x + offset_x, y + offset_y
+    x0, y0 = max(x, clip_x0), max(y, clip_y0)
+    x1, y1 = min(x + width, clip_x1), min(y + height, clip_y1)
+    if x0 >= x1 or y0 >= y1:
         if _settings["debuging_messages"]:
-            _debuging_coordinates(x, y, "set_pixel")
+            _debuging_coordinates(x, y, "set_region")
+        return
+
+    row_size = (x1 - x0) * pixel_size
+    native_row_size = (x1 - x0) * _bytes_per_pixel
+    for row_y in range(y0, y1):
+        start = ((row_y - y) * width + x0 - x) * pixel_size
+        row = data[start:start + row_size]
+        index = (row_y * _width + x0) * _bytes_per_pixel
+        _framebuffer[index:index + native_row_size] = row if native else _native_pixels(row)
+
+    _mark_dirty(x0, y0, x1, y1)
+
+
+def draw_image(x: int, y: int, image, transparent: Color | None = None, width: int | None = None) -> None:
+    """Draw an image (a sprite) with its top left corner at the given coordinates
+
+    The image is converted to the format of the framebuffer the first time it is drawn and kept in a cache,
+    so drawing the same image again only copies its rows. The image is recognized by its identity,
+    so if it is modified a new object should be drawn, like a copy of it.
+
+    The image can be:
+
+      - a PIL image, the pixels with an alpha smaller than 128 are transparent
+      - a list of rows, every row is a list of colors, :python:`None` is a transparent pixel
+      - a buffer (:py:class:`bytes`, NumPy array of ``uint8``...) with 3 bytes (red, green, blue)
+        per pixel and the rows one after the other, ``width`` must be given
+
+    :param x: x coordinate of the top left corner (from the left)
+    :param y: y coordinate of the top left corner (from the top)
+    :param image: The image
+    :param transparent: The pixels with this color aren't drawn
+    :param width: The width of the image, only used if the image is a buffer
+    :raise ValueError: Raise a :py:exc:`ValueError` if the image can't be converted
+    """
+    if transparent is not None:
+        transparent = tuple(transparent)  # the colors can be lists, but the key must be hashable
+    key = (id(image), transparent, width, _bytes_per_pixel)
+    cached = _sprite_cache.get(key)
+    if cached is not None and cached[0] is image:
+        sprite = cached[1]
+    else:
+        sprite = _convert_sprite(image, transparent, width)
+        if len(_sprite_cache) >= _SPRITE_CACHE_SIZE:  # forgets the oldest sprite
+            del _sprite_cache[next(iter(_sprite_cache))]
+        _sprite_cache[key] = (image, sprite)  # keeping the image ensures its id isn't reused
+
+    sprite_width, sprite_height, rows = sprite
+
+    # clips the sprite once
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x, y = x + offset_x, y + offset_y
+    x0, y0 = max(x, clip_x0), max(y, clip_y0)
+    x1, y1 = min(x + sprite_width, clip_x1), min(y + sprite_height, clip_y1)
+    if x0 >= x1 or y0 >= y1:
+        if _settings["debuging_messages"]:
+            _debuging_coordinates(x, y, "draw_image")
+        return
+
+    framebuffer, size = _framebuffer, _bytes_per_pixel
+    clipped = x0 != x or x1 != x + sprite_width
+    for row_y in range(y0, y1):
+        row_index = row_y * _width + x
+        for start, pixels in rows[row_y - y]:
+            if clipped:  # only the visible part of the run is copied
+                end = start + len(pixels) // size
+                visible_start, visible_end = max(start, x0 - x), min(end, x1 - x)
+                if visible_start >= visible_end:
+                    continue
+                pixels = pixels[(visible_start - start) * size:(visible_end - start) * size]
+                start = visible_start
+            index = (row_index + start) * size
+            framebuffer[index:index + len(pixels)] = pixels
 
+    _mark_dirty(x0, y0, x1, y1)
 
 
 def draw_string(
@@ -200,110 +1592,497 @@ def draw_string(
         y: int,
         text: str,
         color: Color = _BLACK,
-        size: Text_size = "medium"
+        size: Text_size = "medium",
+        scale: int = 1,
+        bold: bool = False
 ) -> None:
     """Draw a string on the canvas with the given RGB color and size.
 
+    Every character is turned once into bitmasks (see :file:`glyphs.py`),
+    and the string is rendered into a mask kept in a cache, see the setting ``text_cache_size``.
+    Drawing the same string with the same size again, in any color, places it over the canvas in a single operation.
+
+    The string is clipped against the canvas (or the clip, see :py:func:`push_clip`) before it is placed,
+    so a string that starts outside of the canvas, even with negative coordinates, is partially drawn.
+
     :param x: x coordinate (from the left)
     :param y: y coordinate (from the top)
     :param text: text that will be drawn
     :param color: The color of a pixel
     :param size: Size of the text.
-                 String from the following values: :python:`"small"`, :python:`"medium"` or :python:`"large"`
-    :raise ValueError: Raise a :py:exc:`ValueError` if the size isn't correct
+                 String from the following values: :python:`"small"`, :python:`"medium"` or :python:`"large"`,
+                 or the name of a font loaded by :py:func:`casioplot.font_compiler.load_font`
+    :param scale: Every pixel of the characters is drawn as a square of ``scale`` by ``scale`` pixels
+    :param bold: Draw the characters in bold, they are one pixel wider (before they are scaled)
+    :raise ValueError: Raise a :py:exc:`ValueError` if the size or the scale isn't correct
     """
+    _check_scale(scale)
 
-    def _draw_char() -> None:
-        """Draws a single character"""
-        for y2, row in enumerate(char_map):
-            for x2, pixel in enumerate(row):
-                if pixel == 'X':
-                    set_pixel(x + x2, y + y2, color)
+    if _settings["debuging_messages"]:
+        _debuging_color(color, "draw_string")
+        if not (0 <= x < _settings["width"] and 0 <= y < _settings["height"]):
+            _debuging_coordinates(x, y, "draw_string")
+
+    try:
+        pixel = _native_color(color)
+    except ValueError:  # invalid colors are ignored, like set_pixel does
+        return
 
+    key = (text, size, scale, bold)
+    text_mask = _string_cache.pop(key, None)
+    if text_mask is not None:
+        _string_cache_stats["hits"] += 1
+        _string_cache[key] = text_mask  # it becomes the most recently used string
+    else:
+        _string_cache_stats["misses"] += 1
+        try:
+            text_mask = _render_string(text, size, scale, bold)
+        except ValueError:  # the characters before the unknown one are still drawn
+            for known, char in enumerate(text):
+                try:
+                    _get_glyph(char, size, scale, bold)
+                except ValueError:
+                    break
+            _draw_text_mask(x, y, _render_string(text[:known], size, scale, bold), pixel)
+            raise
+        _cache_string(key, text_mask)
+
+    _draw_text_mask(x, y, text_mask, pixel)
+
+
+def draw_text_box(
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        text: str,
+        color: Color = _BLACK,
+        size: Text_size = "medium"
+) -> None:
+    """Draw a text in a box, the lines are wrapped at the spaces to fit in the width of the box
+
+    The text is laid out with the widths of the characters (see :py:func:`text_size`), the newlines start new lines
+    and the lines that don't fit in the height of the box aren't drawn.
+    The whole box is rendered into a single mask, kept in the same cache as :py:func:`draw_string`,
+    and placed over the canvas in a single operation.
+
+    :param x: x coordinate of the top left corner of the box (from the left)
+    :param y: y coordinate of the top left corner of the box (from the top)
+    :param width: The width of the box
+    :param height: The height of the box
+    :param text: text that will be drawn, it can contain newlines
+    :param color: The color of a pixel
+    :param size: Size of the text, see :py:func:`draw_string`
+    :raise ValueError: Raise a :py:exc:`ValueError` if a character is not implemented for the size
+    """
 
     if _settings["debuging_messages"]:
-        _debuging_color(color, "draw_string")
+        _debuging_color(color, "draw_text_box")
 
-    if y < 0 or y >= _settings["height"]:  # checks if the y coordinate is in bounds of the canvas
-        if _settings["debuging_messages"]:
-            _debuging_coordinates(x, y, "draw_string")
+    try:
+        pixel = _native_color(color)
+    except ValueError:  # invalid colors are ignored, like set_pixel does
         return
 
-    for char in text:
-        if x < 0 or x >= _settings["width"]:  # if the x coordinates isn't in bounds stop
-            if _settings["debuging_messages"]:
-                _debuging_coordinates(x, y, "draw_string")
-            return
+    if width <= 0 or height <= 0:
+        return
 
-        char_map = _get_char(char, size)
-        _draw_char()
-        x += len(char_map[0])
+    key = (text, size, 1, False, width, height)
+    text_mask = _string_cache.pop(key, None)
+    if text_mask is not None:
+        _string_cache_stats["hits"] += 1
+        _string_cache[key] = text_mask  # it becomes the most recently used text
+    else:
+        _string_cache_stats["misses"] += 1
+        text_mask = _render_text_box(text, size, width, height)
+        _cache_string(key, text_mask)
 
+    _draw_text_mask(x, y, text_mask, pixel)
 
 
-try:
-    # window
+def text_size(text: str, size: Text_size = "medium", scale: int = 1, bold: bool = False) -> tuple[int, int]:
+    """Get the size in pixels of a string drawn by :py:func:`draw_string`, without drawing it
 
-    _window = tk.Tk()
-    """The tkinter window that shows the virtual screen
+    The width is the sum of the widths of the characters, read from a table, so the characters aren't decoded.
+    The height is the height of a line, it is the same for every string of the given size.
+    Both are multiplied by the scale, and a bold character is one pixel wider before it is scaled.
 
-    :meta hide-value:
+    :param text: The text
+    :param size: Size of the text.
+                 String from the following values: :python:`"small"`, :python:`"medium"` or :python:`"large"`,
+                 or the name of a font loaded by :py:func:`casioplot.font_compiler.load_font`
+    :param scale: The scale of the text, see :py:func:`draw_string`
+    :param bold: If the text is bold
+    :return: The width and the height of the string
+    :raise ValueError: Raise a :py:exc:`ValueError` if a character is not implemented for the size
+                      or if the scale isn't correct
     """
+    _check_scale(scale)
+    advances, height = _get_metrics(size)
+    try:
+        width = sum(map(advances.__getitem__, text))
+    except KeyError as error:
+        raise ValueError(f"Character '{error.args[0]}' not implemented for size {size}") from None
+    if bold:
+        width += len(text)
+    return width * scale, height * scale
 
-    if _settings["show_screen"] is True:
-        _window.geometry("{}x{}".format(*_screen_dimensions()))
-        _window.title("casioplot")
-        _window.grab_release()
-        _window.attributes("-topmost", True)
-        _window.resizable(False, False)
-    else:
-        _window.withdraw()
 
-    # screen
+def text_cache_info() -> dict[str, int]:
+    """Get the statistics of the cache of the strings drawn by :py:func:`draw_string`
 
-    _canvas = tk.PhotoImage(width=_settings["width"], height=_settings["height"])
-    """The canvas that the user can interact with using the functions from this module
+    A string is found in the cache (a hit) if it was already drawn with the same size, in any color,
+    otherwise it is rendered and added to the cache (a miss).
+    They help to choose the value of the setting ``text_cache_size``.
 
-    :meta hide-value:
+    :return: A dictionary with the number of ``"hits"`` and ``"misses"``, the number of ``"strings"`` in the cache
+             and the ``"memory"`` it uses, in bytes
+    """
+    return {
+        "hits": _string_cache_stats["hits"],
+        "misses": _string_cache_stats["misses"],
+        "strings": len(_string_cache),
+        "memory": _string_cache_stats["memory"],
+    }
+
+
+def create_layer(name: str, z: int = -1, transparent: Color | None = None) -> None:
+    """Create a layer, a second canvas stacked below or above the main canvas
+
+    A layer has its own framebuffer, select it with :py:func:`select_layer` to draw on it.
+    The layers are only composited again when they change, so they are useful for parts of the screen
+    that don't change every frame:
+
+      - the layers with a negative ``z`` are below the canvas, like a grid or axes.
+        They are shown when the canvas is cleared to white by :py:func:`clear_screen`,
+        which restores their cached composite instead of redrawing them
+      - the layers with a positive ``z`` are above the canvas, like a menu.
+        They are placed over the canvas by :py:func:`show_screen`
+
+    The layers with a greater ``z`` are above the others. A new layer is filled with its transparent color,
+    or with white if it's opaque.
+
+    :param name: The name of the layer
+    :param z: The position of the layer, it can't be 0, the position of the canvas
+    :param transparent: The pixels of the layer with this color are transparent, None for an opaque layer
+    :raise ValueError: Raise a :py:exc:`ValueError` if the name is already used, if ``z`` is 0
+                       or if the transparent color is invalid
     """
-    clear_screen()  # ensures the pixels are set to white and not transparent
+    if name in _layers:
+        raise ValueError(f"The layer {name!r} already exists")
+    if z == 0:
+        raise ValueError("The z of a layer can't be 0, the canvas is there")
 
-    if _settings["bg_in_use"] is True:
-        _background = tk.PhotoImage(file=_settings["background"])
-        """The background image that is shown behind the canvas
+    _layers[name] = _Layer(z, None if transparent is None else _native_color(transparent))
 
-        :meta hide-value:
-        """
+
+def select_layer(name: str | None = None) -> None:
+    """Select the layer that the drawing functions use, every function of :py:mod:`casioplot` draws on it
+
+    The regions drawn on a layer are composited again by the next :py:func:`show_screen`,
+    even if another layer or the canvas is selected before.
+
+    :param name: The name of the layer, None selects the canvas
+    :raise ValueError: Raise a :py:exc:`ValueError` if the layer doesn't exist
+    """
+    global _framebuffer, _current_layer
+    _take_layer_pixels()  # the pixels set on the layer that was selected
+
+    if name is None:
+        _framebuffer = _canvas_framebuffer
+    elif name in _layers:
+        _framebuffer = _layers[name].framebuffer
     else:
-        bg_width, bg_height = _screen_dimensions()
-        _background = tk.PhotoImage(width=bg_width, height=bg_height)
-        _background.put(  # same as clear_screen but for the background image
-            "white",
-            to=(0, 0, bg_width, bg_height)
-        )
+        raise ValueError(f"The layer {name!r} doesn't exist")
+    _current_layer = name
+
 
-    _background_display = tk.Label(master=_window, image=_background, border=0)
-    """The tkinter label that shows the background image
+def delete_layer(name: str) -> None:
+    """Delete a layer, the canvas is selected if the layer was selected
 
-    :meta hide-value:
+    :param name: The name of the layer
+    :raise ValueError: Raise a :py:exc:`ValueError` if the layer doesn't exist
     """
-    _canvas_display = tk.Label(master=_window, image=_canvas, border=0)
-    """The tkinter label that shows the canvas
+    if name not in _layers:
+        raise ValueError(f"The layer {name!r} doesn't exist")
+
+    global _canvas_blank, _overlay
+    if _current_layer == name:
+        select_layer()
+
+    layer = _layers.pop(name)
+    same_side = [other for other in _layers.values() if (other.z < 0) == (layer.z < 0)]
+    for other in same_side:  # the side of the canvas of the layer needs to be composited again
+        other.dirty = True
+
+    if same_side:
+        return
+    if layer.z < 0:  # there are no more layers below the canvas
+        _canvas_blank = _blank_framebuffer
+    else:  # there are no more layers above the canvas
+        _overlay = None
+        _mark_dirty(0, 0, _width, _height)
+
+
+def push_clip(x: int, y: int, width: int, height: int, viewport: bool = False) -> None:
+    """Restrict the drawing to a rectangle, until :py:func:`pop_clip` is called
+
+    The drawing functions don't change the pixels outside the rectangle. The clipping is done once
+    per rectangle, span or image, so drawing shapes that leave the rectangle costs nothing more.
+    The clip rectangles can be nested, the new one is the intersection with the current one.
+
+    If ``viewport`` is True the coordinates are also moved,
+    the top left corner of the rectangle becomes the point ``(0, 0)`` of every function.
+
+    :param x: x coordinate of the top left corner (from the left)
+    :param y: y coordinate of the top left corner (from the top)
+    :param width: Width of the rectangle in pixels
+    :param height: Height of the rectangle in pixels
+    :param viewport: Move the coordinates to the top left corner of the rectangle
+    """
+    global _viewport
+    _viewport_stack.append(_viewport)
+
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x, y = x + offset_x, y + offset_y
+    clip_x0, clip_y0 = max(x, clip_x0), max(y, clip_y0)
+    clip_x1, clip_y1 = max(min(x + width, clip_x1), clip_x0), max(min(y + height, clip_y1), clip_y0)
+    if viewport:
+        offset_x, offset_y = x, y
+    _viewport = (offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1)
+
+
+def pop_clip() -> None:
+    """Restore the clip rectangle and the coordinates used before the last :py:func:`push_clip`
 
-    :meta hide-value:
+    :raise ValueError: Raise a :py:exc:`ValueError` if there isn't any clip rectangle to remove
     """
-    _background_display.place(x=0, y=0)
-    _canvas_display.place(x=_settings["left"], y=_settings["top"])
+    global _viewport
+    if not _viewport_stack:
+        raise ValueError("pop_clip was called more times than push_clip")
+    _viewport = _viewport_stack.pop()
+
+
+def copy_rect(x: int, y: int, width: int, height: int, to_x: int, to_y: int) -> None:
+    """Copy a rectangle of the canvas to another position, the two positions can overlap
+
+    The pixels are moved in bulk, a few slice assignments instead of one operation per pixel.
+    Only the destination is clipped by the clip rectangle, the source can be anywhere in the canvas.
+
+    :param x: x coordinate of the top left corner of the source (from the left)
+    :param y: y coordinate of the top left corner of the source (from the top)
+    :param width: Width of the rectangle in pixels
+    :param height: Height of the rectangle in pixels
+    :param to_x: x coordinate of the top left corner of the destination (from the left)
+    :param to_y: y coordinate of the top left corner of the destination (from the top)
+    """
+    offset_x, offset_y, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    x0, y0, to_x, to_y = x + offset_x, y + offset_y, to_x + offset_x, to_y + offset_y
+
+    # clips the source to the canvas and the destination to the clip rectangle, the other one follows
+    left = max(-x0, clip_x0 - to_x, 0)
+    top = max(-y0, clip_y0 - to_y, 0)
+    right = min(_width - x0, clip_x1 - to_x, width)
+    bottom = min(_height - y0, clip_y1 - to_y, height)
+    if left >= right or top >= bottom:
+        if _settings["debuging_messages"]:
+            _debuging_coordinates(x, y, "copy_rect")
+        return
+
+    _copy_rect_clipped((x0 + left, y0 + top, x0 + right, y0 + bottom), to_x + left, to_y + top)
+
+
+def scroll(dx: int, dy: int, fill: Color | None = _WHITE) -> None:
+    """Scroll the content of the canvas, or of the clip rectangle, by the given number of pixels
+
+    The pixels are moved in bulk, like :py:func:`copy_rect` does, and the strips that become empty
+    are filled with a color. When the canvas is scrolled only these strips need to be sent to the screen.
+
+    :param dx: Number of pixels to move to the right, negative to move to the left
+    :param dy: Number of pixels to move to the bottom, negative to move to the top
+    :param fill: The color of the empty strips, None to keep their old pixels
+    """
+    _, _, clip_x0, clip_y0, clip_x1, clip_y1 = _viewport
+    if abs(dx) < clip_x1 - clip_x0 and abs(dy) < clip_y1 - clip_y0 and (dx or dy):
+        region = (clip_x0 + max(-dx, 0), clip_y0 + max(-dy, 0), clip_x1 - max(dx, 0), clip_y1 - max(dy, 0))
+        _copy_rect_clipped(region, region[0] + dx, region[1] + dy)
+    elif dx or dy:  # everything leaves the clip rectangle
+        dx, dy = clip_x1 - clip_x0, 0
+
+    if fill is None:
+        return
+    if _settings["debuging_messages"]:
+        _debuging_color(fill, "scroll")
+    try:
+        pixel = _native_color(fill)
+    except ValueError:  # invalid colors are ignored, like set_pixel does
+        return
+
+    if dx > 0:
+        _fill_rect_clipped(clip_x0, clip_y0, clip_x0 + dx, clip_y1, pixel)
+    elif dx < 0:
+        _fill_rect_clipped(clip_x1 + dx, clip_y0, clip_x1, clip_y1, pixel)
+    if dy > 0:
+        _fill_rect_clipped(clip_x0, clip_y0, clip_x1, clip_y0 + dy, pixel)
+    elif dy < 0:
+        _fill_rect_clipped(clip_x0, clip_y1 + dy, clip_x1, clip_y1, pixel)
+
+
+
+# framebuffer
+
+_width: int = _settings["width"]
+"""Width of the canvas, cached to avoid a dictionary lookup for every pixel"""
+_height: int = _settings["height"]
+"""Height of the canvas, cached to avoid a dictionary lookup for every pixel"""
+
+_rgb565: bool = _settings["rgb565"]
+"""If True the framebuffer stores the pixels in RGB565, like the screen of the calculators"""
+_bytes_per_pixel: int = 2 if _rgb565 else 3
+"""Number of bytes used by a pixel in the framebuffer"""
+
+_blank_framebuffer: bytes = (_native_color(_WHITE) if _rgb565 else bytes(_WHITE)) * (_width * _height)
+"""A white framebuffer, used by :py:func:`clear_screen`, white isn't corrected by ``correct_colors``
+
+:meta hide-value:
+"""
 
-except tk.TclError:
-    print("The tkinter window couldn't be created. The screen won't be shown.")
+_canvas_framebuffer = bytearray(_blank_framebuffer)
+"""The canvas that the user can interact with using the functions from this module
+
+Every pixel takes 3 bytes (red, green and blue), or 2 bytes in RGB565 mode (see :file:`colors.py`),
+and the rows are stored one after the other.
+It is the back buffer, every drawing function writes to it and :py:func:`show_screen`
+copies it to the front buffer :py:data:`_front_buffer`.
+
+:meta hide-value:
+"""
+
+_framebuffer: bytearray = _canvas_framebuffer
+"""The framebuffer used by the drawing functions, the canvas or the framebuffer of the selected layer
+
+:meta hide-value:
+"""
+
+_front_buffer: bytearray = bytearray(_rgb565_to_rgb(_blank_framebuffer) if _rgb565 else _blank_framebuffer)
+"""The front buffer, the content of the screen shown by the backend
+
+The changed regions of :py:data:`_framebuffer`, the back buffer, are copied to it by :py:func:`show_screen`.
+It always stores the pixels in RGB, the format used by the backends.
+
+:meta hide-value:
+"""
+
+# layers
+
+_layers: dict[str, _Layer] = {}
+"""The layers created by :py:func:`create_layer`, by name"""
+
+_current_layer: str | None = None
+"""The name of the layer selected by :py:func:`select_layer`, None for the canvas"""
+
+_canvas_blank: bytes = _blank_framebuffer
+"""The composite of the layers below the canvas, restored by :py:func:`clear_screen`
+
+:meta hide-value:
+"""
+
+_overlay: tuple[bytes, bytes] | None = None
+"""The composite of the layers above the canvas and its mask, None if there isn't any
+
+:meta hide-value:
+"""
+
+# clipping
+
+_viewport: tuple[int, int, int, int, int, int] = (0, 0, 0, 0, _width, _height)
+"""The offset added to the coordinates and the clip rectangle, ``(offset_x, offset_y, x0, y0, x1, y1)``
+
+The clip rectangle is always inside the canvas, see :py:func:`push_clip`
+"""
+
+_viewport_stack: list[tuple[int, int, int, int, int, int]] = []
+"""The previous values of :py:data:`_viewport`, restored by :py:func:`pop_clip`"""
+
+# dirty tracking
+
+_pending_copies: list[tuple[Rect, int, int]] = []
+"""The copies done by :py:func:`copy_rect` and :py:func:`scroll` since the last :py:func:`show_screen`,
+``(region, x, y)``, they are replayed on the front buffer and by the backend
+"""
+
+_dirty_rects: list[Rect] = [(0, 0, _width, _height)]
+"""The regions changed by functions like :py:func:`clear_screen` since the last :py:func:`show_screen`
+
+The whole canvas is sent by the first :py:func:`show_screen`, so the backend shows exactly the front buffer
+"""
+
+_NO_DIRTY_PIXELS: Rect = (_width, _height, 0, 0)
+"""An empty bounding box, any pixel grows it"""
+
+_dirty_pixels: list[int] = list(_NO_DIRTY_PIXELS)
+"""The bounding box ``[x0, y0, x1, y1]`` of the pixels set by :py:func:`set_pixel`
+since the last :py:func:`show_screen`
+
+A list is used so :py:func:`set_pixel` can update it without the global statement.
+"""
+
+_depth_buffer: array | None = None
+"""The depth of every pixel of the canvas, used by the 3D functions like
+:py:func:`casioplot.shapes.draw_triangles` to hide the pixels behind others
+
+It is only created when it is needed, and is reset by :py:func:`clear_depth_buffer`
+
+:meta hide-value:
+"""
+
+
+# frame pacing
+
+_frame_stats = {
+    "frames": 0,
+    "skipped": 0,
+    "frame_time": 0.0,
+    "work_time": 0.0,
+    "sleep_time": 0.0,
+    "present_time": 0.0,
+}
+"""The timing of the frames, returned by :py:func:`frame_info`"""
+
+_frame_end_time: float = perf_counter()
+"""The time at the end of the last frame shown by :py:func:`show_screen`, the start of the program at first"""
+
+_next_frame_time: float | None = None
+"""The time at which the next frame must be shown, set by the first :py:func:`show_screen`"""
+
+_frame_lateness = 0.0
+"""How late the last frame was, in seconds, a frame is only skipped if it is a frame later than this"""
+
+
+# background and backend
+
+_background: Image.Image
+"""The background image that is shown behind the canvas
+
+:meta hide-value:
+"""
+if _settings["bg_in_use"] is True:
+    _background = Image.open(_settings["background"]).convert("RGB")
+else:
+    _background = Image.new("RGB", _screen_dimensions(), _WHITE)
+
+_backend = _create_backend(_width, _height, _background)
+"""The backend that shows the screen, see :file:`backends.py`
+
+:meta hide-value:
+"""
 
 
 @atexit.register
 def _run_at_exit() -> None:
     """This function should be called at the end of the program to close the tkinter window"""
+    _present()  # the last frame may not have been shown
     if _settings["save_screen"] is True:  # saves the thes screen as it was before the program ended
         _save_screen()
 
-    if _settings["show_screen"] is True and _settings["close_window"] is False:  # keeps the tkinter window open after the program ends
-        _window.mainloop()
+    _backend.run_at_exit()  # the tkinter backend may keep the window open after the program ends
@@ -0,0 +1,177 @@
+"""Contains the color tables and the conversions between the pixel formats of the framebuffer
+
+The framebuffer can store the pixels in two formats:
+
+  - RGB, 3 bytes per pixel (red, green, blue), the default
+  - RGB565, 2 bytes per pixel (a little endian integer with 5 bits of red, 6 of green and 5 of blue),
+    the format of the screen of the casio calculators, used if the setting ``rgb565`` is True
+
+The conversions of many pixels are done with :py:meth:`bytes.translate` and integer operations,
+so they never loop over the pixels in python. The layers are composited the same way,
+see :py:func:`_opaque_mask` and :py:func:`_composite_bytes`.
+"""
+
+from casioplot.types import Color
+
+# translation tables used to correct the colors of many pixels at once
+_CORRECT_5_BITS = bytes(value - value % 8 for value in range(256))
+"""Translation table that keeps only the 5 most significant bits of a channel
+
+:meta hide-value:
+"""
+
+_CORRECT_6_BITS = bytes(value - value % 4 for value in range(256))
+"""Translation table that keeps only the 6 most significant bits of a channel
+
+:meta hide-value:
+"""
+
+# lookup tables used to convert a color to RGB565, the three values just need to be or'ed
+_RED_TO_565 = tuple((value >> 3) << 11 for value in range(256))
+"""The red channel of a color in its position in a RGB565 pixel
+
+:meta hide-value:
+"""
+
+_GREEN_TO_565 = tuple((value >> 2) << 5 for value in range(256))
+"""The green channel of a color in its position in a RGB565 pixel
+
+:meta hide-value:
+"""
+
+_BLUE_TO_565 = tuple(value >> 3 for value in range(256))
+"""The blue channel of a color in its position in a RGB565 pixel
+
+:meta hide-value:
+"""
+
+# translation tables used to convert many pixels from and to RGB565, the low byte is the first one
+_RED_TO_HIGH = bytes(value & 0b11111000 for value in range(256))
+_GREEN_TO_HIGH = bytes(value >> 5 for value in range(256))
+_GREEN_TO_LOW = bytes(((value >> 2) & 0b111) << 5 for value in range(256))
+_BLUE_TO_LOW = bytes(value >> 3 for value in range(256))
+_HIGH_TO_RED = bytes(value & 0b11111000 for value in range(256))
+_HIGH_TO_GREEN = bytes((value & 0b111) << 5 for value in range(256))
+_LOW_TO_GREEN = bytes((value >> 5) << 2 for value in range(256))
+_LOW_TO_BLUE = bytes((value & 0b11111) << 3 for value in range(256))
+
+_NOT_ZERO = bytes(0 if value == 0 else 0xFF for value in range(256))
+"""Translation table that sets every byte that isn't zero to 0xFF, used to create masks
+
+:meta hide-value:
+"""
+
+
+def _or_bytes(first: bytes, second: bytes) -> bytes:
+    """Computes the bitwise or of two byte strings with the same length, using python big integers"""
+    return (int.from_bytes(first) | int.from_bytes(second)).to_bytes(len(first))
+
+
+def _correct_colors_bytes(pixels: bytes) -> bytearray:
+    """Corrects the colors of RGB pixels to match the behavior of the casio calculators
+
+    Same correction as :py:func:`casioplot.casioplot.set_pixel` but done for every pixel
+    by :py:meth:`bytes.translate`
+
+    :param pixels: The pixels, 3 bytes (red, green, blue) per pixel
+    :return: The corrected pixels
+    """
+    pixels = bytearray(pixels)
+    pixels[0::3] = pixels[0::3].translate(_CORRECT_5_BITS)
+    pixels[1::3] = pixels[1::3].translate(_CORRECT_6_BITS)
+    pixels[2::3] = pixels[2::3].translate(_CORRECT_5_BITS)
+    return pixels
+
+
+def _color_to_rgb565(color: Color) -> int:
+    """Converts a color to a RGB565 pixel
+
+    The channels are checked before they are used in the lookup tables, a negative index would be accepted.
+
+    :param color: The color
+    :return: The RGB565 value, an integer from 0 to 65535
+    :raise ValueError: Raise a :py:exc:`ValueError` if the color doesn't have three channels in the range [0, 255]
+    """
+    try:
+        red, green, blue = color
+        valid = 0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255
+    except (TypeError, ValueError):  # not three channels, or channels that aren't numbers
+        valid = False
+    if not valid:
+        raise ValueError(f"Invalid color {color}")
+    return _RED_TO_565[red] | _GREEN_TO_565[green] | _BLUE_TO_565[blue]
+
+
+def _rgb565_to_color(value: int) -> Color:
+    """Converts a RGB565 pixel to a color, the same way the calculators do
+
+    :param value: The RGB565 value
+    :return: The color, the least significant bits of the channels are zero
+    """
+    return (value >> 8) & 0b11111000, (value >> 3) & 0b11111100, (value << 3) & 0b11111000
+
+
+def _rgb_to_rgb565(pixels: bytes) -> bytearray:
+    """Converts RGB pixels to RGB565 pixels
+
+    :param pixels: The pixels, 3 bytes (red, green, blue) per pixel
+    :return: The pixels, 2 bytes per pixel
+    """
+    pixels = bytes(pixels)
+    red, green, blue = pixels[0::3], pixels[1::3], pixels[2::3]
+
+    converted = bytearray(len(red) * 2)
+    converted[0::2] = _or_bytes(green.translate(_GREEN_TO_LOW), blue.translate(_BLUE_TO_LOW))
+    converted[1::2] = _or_bytes(red.translate(_RED_TO_HIGH), green.translate(_GREEN_TO_HIGH))
+    return converted
+
+
+def _rgb565_to_rgb(pixels: bytes) -> bytearray:
+    """Converts RGB565 pixels to RGB pixels
+
+    :param pixels: The pixels, 2 bytes per pixel
+    :return: The pixels, 3 bytes (red, green, blue) per pixel
+    """
+    pixels = bytes(pixels)
+    low, high = pixels[0::2], pixels[1::2]
+
+    converted = bytearray(len(low) * 3)
+    converted[0::3] = high.translate(_HIGH_TO_RED)
+    converted[1::3] = _or_bytes(high.translate(_HIGH_TO_GREEN), low.translate(_LOW_TO_GREEN))
+    converted[2::3] = low.translate(_LOW_TO_BLUE)
+    return converted
+
+
+def _opaque_mask(pixels: bytes, transparent: bytes) -> bytes:
+    """Creates the mask of the pixels that are different from a transparent pixel
+
+    :param pixels: The pixels, in any format
+    :param transparent: The bytes of the transparent pixel, in the same format
+    :return: A mask with the same length as ``pixels``, every byte of a pixel is 0xFF if the pixel
+             is opaque and 0 if it is transparent
+    """
+    size = len(transparent)
+    different = (
+        int.from_bytes(pixels) ^ int.from_bytes(transparent * (len(pixels) // size))
+    ).to_bytes(len(pixels)).translate(_NOT_ZERO)
+
+    opaque = different[0::size]  # a pixel is opaque if any of its bytes is different
+    for offset in range(1, size):
+        opaque = _or_bytes(opaque, different[offset::size])
+
+    mask = bytearray(len(pixels))
+    for offset in range(size):
+        mask[offset::size] = opaque
+    return bytes(mask)
+
+
+def _composite_bytes(under: bytes, over: bytes, mask: bytes) -> bytes:
+    """Places pixels over others, using a mask
+
+    :param under: The pixels below
+    :param over: The pixels above, in the same format
+    :param mask: The mask of ``over``, see :py:func:`_opaque_mask`
+    :return: The bytes of ``over`` where the mask is 0xFF and the bytes of ``under`` elsewhere
+    """
+    below = int.from_bytes(under)
+    return (below ^ ((below ^ int.from_bytes(over)) & int.from_bytes(mask))).to_bytes(len(mask))
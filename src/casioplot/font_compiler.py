@@ -0,0 +1,225 @@
+"""Contains the font compiler, it turns fonts into the format of :file:`characters.py`
+
+A compiled font is a new size for :py:func:`casioplot.casioplot.draw_string` and
+:py:func:`casioplot.casioplot.text_size`, so it is drawn as fast as the three sizes of the calculators.
+
+Supported fonts:
+  - BDF bitmap fonts, read by :py:func:`_compile_bdf`
+  - the fonts that PIL can open, its bitmap fonts (:file:`.pil`) and the scalable fonts (TrueType, OpenType...),
+    rendered by :py:func:`_compile_pil`
+
+The compiled fonts are saved in :py:data:`_CACHE_DIR`, the name of the file is the hash of the source font
+and of the options, so a font is only compiled again if it changes.
+
+Available functions for the user:
+  - :py:func:`load_font`
+"""
+
+import hashlib
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+from casioplot.characters import _add_font_data, _encode_fonts, _map_font_file
+
+_FORMAT_VERSION = b"1"
+"""Part of the hash of the compiled fonts, changing it compiles every font again"""
+
+_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "casioplot", "fonts")
+"""The directory where the compiled fonts are saved"""
+
+_PRINTABLE_ASCII = "".join(chr(code_point) for code_point in range(32, 127))
+"""The characters of the three sizes of the calculators, compiled by default"""
+
+_BUILTIN_SIZES = ("small", "medium", "large")
+"""The sizes of the calculators, they can't be used as the name of a font"""
+
+_loaded_fonts: dict[str, str] = {}
+"""The fonts loaded by :py:func:`load_font`, the hash of every font by name"""
+
+_Glyphs = dict[str, tuple[int, tuple[int, ...]]]
+"""The characters of a compiled font, see :py:func:`casioplot.characters._encode_fonts`"""
+
+
+def _check_glyph_size(char: str, width: int, height: int) -> None:
+    """Checks that a character fits in the format of the font files
+
+    :raise ValueError: Raise a :py:exc:`ValueError` if the width or the height is greater than 255
+    """
+    if width > 255 or height > 255:
+        raise ValueError(f"The character '{char}' is too big, {width}x{height}, the maximum is 255x255")
+
+
+def _compile_bdf(source: bytes) -> _Glyphs:
+    """Compiles a BDF font
+
+    Every character is placed in a cell as wide as its advance (``DWIDTH``) and as high as the font
+    (``FONT_ASCENT`` plus ``FONT_DESCENT``, or the ``FONTBOUNDINGBOX``), the pixels outside the cell are ignored.
+    The characters without an encoding are ignored.
+
+    :param source: The content of the BDF file
+    :return: The compiled characters
+    :raise ValueError: Raise a :py:exc:`ValueError` if the file isn't a valid BDF font
+    """
+    ascent = descent = None
+    bounding_box = (0, 0, 0, 0)
+    characters = []
+
+    lines = iter(source.decode("latin-1").splitlines())
+    for line in lines:
+        words = line.split()
+        if not words:
+            continue
+
+        if words[0] == "FONTBOUNDINGBOX":
+            bounding_box = tuple(int(word) for word in words[1:5])
+        elif words[0] == "FONT_ASCENT":
+            ascent = int(words[1])
+        elif words[0] == "FONT_DESCENT":
+            descent = int(words[1])
+        elif words[0] == "STARTCHAR":
+            encoding, advance, box, rows = -1, 0, (0, 0, 0, 0), []
+            for char_line in lines:
+                char_words = char_line.split()
+                if not char_words:
+                    continue
+                if char_words[0] == "ENCODING":
+                    encoding = int(char_words[1])
+                elif char_words[0] == "DWIDTH":
+                    advance = int(char_words[1])
+                elif char_words[0] == "BBX":
+                    box = tuple(int(word) for word in char_words[1:5])
+                elif char_words[0] == "BITMAP":
+                    rows = [next(lines).strip() for _ in range(box[1])]
+                elif char_words[0] == "ENDCHAR":
+                    break
+            characters.append((encoding, advance, box, rows))
+
+    if ascent is None or descent is None:
+        ascent, descent = bounding_box[1] + bounding_box[3], -bounding_box[3]
+    height = ascent + descent
+    if height <= 0 or not characters:
+        raise ValueError("The BDF font has no characters")
+
+    glyphs: _Glyphs = {}
+    for encoding, advance, (width, box_height, offset_x, offset_y), rows in characters:
+        if encoding < 0:
+            continue
+        char = chr(encoding)
+        _check_glyph_size(char, advance, height)
+
+        masks = [0] * height
+        top = ascent - offset_y - box_height  # the row of the cell of the first row of the bitmap
+        for row_y, row in enumerate(rows, top):
+            if not 0 <= row_y < height:
+                continue
+            bits, bit_count = int(row, 16), len(row) * 4  # the first pixel is the most significant bit
+            for column in range(width):
+                x = offset_x + column
+                if bits >> (bit_count - 1 - column) & 1 and 0 <= x < advance:
+                    masks[row_y] |= 1 << x
+        glyphs[char] = (advance, tuple(masks))
+    return glyphs
+
+
+def _compile_pil(path: str, size: int | None, characters: str) -> _Glyphs:
+    """Compiles a font with PIL, every character is drawn without anti-aliasing
+
+    :param path: The path of the font
+    :param size: The size in pixels for the scalable fonts, None for the PIL bitmap fonts
+    :param characters: The characters to compile, the characters with no width are ignored
+    :return: The compiled characters
+    """
+    font = ImageFont.load(path) if size is None else ImageFont.truetype(path, size)
+
+    height = max(font.getbbox(char)[3] for char in characters)
+    if hasattr(font, "getmetrics"):  # the scalable fonts know the height of a line
+        height = max(height, sum(font.getmetrics()))
+
+    glyphs: _Glyphs = {}
+    for char in characters:
+        advance = round(font.getlength(char))
+        if advance <= 0:
+            continue
+        _check_glyph_size(char, advance, height)
+
+        image = Image.new("L", (advance, height), 0)
+        draw = ImageDraw.Draw(image)
+        draw.fontmode = "1"
+        draw.text((0, 0), char, fill=255, font=font)
+
+        pixels = image.tobytes()
+        glyphs[char] = (advance, tuple(
+            sum(1 << x for x, value in enumerate(pixels[start:start + advance]) if value)
+            for start in range(0, len(pixels), advance)
+        ))
+    return glyphs
+
+
+def _font_hash(path: str, source: bytes, options: tuple) -> str:
+    """Computes the hash of a font, used as the name of the compiled font
+
+    The images of the PIL bitmap fonts, next to the :file:`.pil` file, are part of the hash.
+
+    :param path: The path of the font
+    :param source: The content of the font file
+    :param options: The options of the compilation
+    :return: The hash, in hexadecimal
+    """
+    digest = hashlib.sha256(_FORMAT_VERSION)
+    digest.update(source)
+    for extension in (".png", ".pbm", ".gif"):
+        image_path = os.path.splitext(path)[0] + extension
+        if path.endswith(".pil") and os.path.exists(image_path):
+            with open(image_path, "rb") as image_file:
+                digest.update(image_file.read())
+    digest.update(repr(options).encode())
+    return digest.hexdigest()
+
+
+# functions for the user
+
+
+def load_font(path: str, name: str, size: int | None = None, characters: str = _PRINTABLE_ASCII) -> None:
+    """Load a font, then use its name as the size of :py:func:`casioplot.casioplot.draw_string`
+
+    The font is compiled the first time and saved in a cache, so the next programs load it directly.
+    Loading the same font again with the same name does nothing.
+
+    :param path: The path of the font, a BDF font, a PIL bitmap font (:file:`.pil`)
+                 or a scalable font (TrueType, OpenType...)
+    :param name: The name of the font
+    :param size: The size in pixels, only for the scalable fonts
+    :param characters: The characters to compile, the BDF fonts always have all their characters
+    :raise ValueError: Raise a :py:exc:`ValueError` if the name is already used or if the font can't be compiled
+    """
+    with open(path, "rb") as file:
+        source = file.read()
+    is_bdf = source.lstrip().startswith(b"STARTFONT")
+    font_hash = _font_hash(path, source, ("bdf",) if is_bdf else (size, characters))
+
+    if _loaded_fonts.get(name) == font_hash:
+        return
+    if name in _BUILTIN_SIZES or name in _loaded_fonts:
+        raise ValueError(f"The name {name!r} is already used by another font")
+
+    cache_file = os.path.join(_CACHE_DIR, font_hash + ".bin")
+    if os.path.exists(cache_file):
+        data = _map_font_file(cache_file)
+    else:
+        try:
+            glyphs = _compile_bdf(source) if is_bdf else _compile_pil(path, size, characters)
+        except OSError as error:  # raised by PIL if it can't read the font
+            raise ValueError(f"The font {path} can't be compiled: {error}") from None
+        data = _encode_fonts({"font": glyphs})
+
+        try:  # written to a temporary file first, so another program never reads half of it
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            temporary_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(temporary_file, "wb") as file:
+                file.write(data)
+            os.replace(temporary_file, cache_file)
+        except OSError:  # without a cache the font is only kept in memory
+            pass
+
+    _add_font_data(data, (name,))
+    _loaded_fonts[name] = font_hash
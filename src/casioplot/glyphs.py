@@ -0,0 +1,73 @@
+"""Contains the glyphs used by :py:func:`casioplot.casioplot.draw_string`
+
+A glyph is the width, the height and the rows of a character, every row is a bitmask
+where the bit ``x`` is set if the pixel ``x`` of the row is drawn, read from :file:`characters.py`.
+The bitmasks of the characters of a string are placed side by side to render the whole string at once.
+
+The scaled and bold glyphs are derived from the glyph of the character in its size, see :py:func:`_get_glyph`.
+
+The glyphs are kept in :py:data:`_glyph_cache`, so every glyph is only made once.
+"""
+
+from casioplot.characters import _get_char_masks
+from casioplot.types import Text_size
+
+_Glyph = tuple[int, int, tuple[int, ...]]
+"""A character, ``(width, height, masks)``, ``masks`` has a bitmask for every row"""
+
+_glyph_cache: dict[tuple[str, Text_size, int, bool], _Glyph] = {}
+"""The glyphs already made by :py:func:`_get_glyph`, by character, size, scale and bold
+
+:meta hide-value:
+"""
+
+
+def _scale_mask(mask: int, scale: int) -> int:
+    """Scales a row bitmask horizontally, every pixel becomes ``scale`` pixels
+
+    :param mask: The bitmask, the bit ``x`` is the pixel ``x``
+    :param scale: The scale
+    :return: The scaled bitmask
+    """
+    block = (1 << scale) - 1
+    scaled = 0
+    x = 0
+    while mask:
+        if mask & 1:
+            scaled |= block << x
+        mask >>= 1
+        x += scale
+    return scaled
+
+
+def _get_glyph(char: str, size: Text_size = "medium", scale: int = 1, bold: bool = False) -> _Glyph:
+    """Gets the glyph of a character in a given size, it is made the first time
+
+    A bold glyph is one pixel wider, every row is drawn twice, the second copy shifted one pixel to the right.
+    A scaled glyph has every pixel replaced by a square of ``scale`` by ``scale`` pixels, after it is made bold.
+
+    :param char: The character
+    :param size: The size of the character
+    :param scale: The scale of the character
+    :param bold: If the character is bold
+    :return: The glyph
+    :raises ValueError: If the character is not implemented for the given size
+    """
+    key = (char, size, scale, bold)
+    glyph = _glyph_cache.get(key)
+    if glyph is not None:
+        return glyph
+
+    if scale == 1 and not bold:
+        width, masks = _get_char_masks(char, size)
+    else:
+        width, _, masks = _get_glyph(char, size)
+        if bold:
+            width, masks = width + 1, tuple(mask | mask << 1 for mask in masks)
+        if scale > 1:
+            width, masks = width * scale, tuple(
+                scaled for scaled in (_scale_mask(mask, scale) for mask in masks) for _ in range(scale)
+            )
+
+    glyph = _glyph_cache[key] = (width, len(masks), masks)
+    return glyph
@@ -127,7 +127,9 @@ _toml_structure = {
     ),
     "showing_screen": (
         "show_screen",
-        "close_window"
+        "close_window",
+        "target_fps",
+        "skip_frames"
     ),
     "saving_screen": (
         "save_screen",
@@ -139,6 +141,8 @@ _toml_structure = {
     "others": (
         "correct_colors",
         "debuging_messages",
+        "rgb565",
+        "text_cache_size",
     ),
 }
 _toml_sections = tuple(_toml_structure.keys())
@@ -319,7 +323,8 @@ def _check_settings(config: Configuration) -> None:
         "top": lambda top: top >= 0,
         "bottom": lambda bottom: bottom >= 0,
         "image_format": lambda image_format: image_format in ("jpeg", "jpg", "png", "gif", "bmp", "tiff", "tif"),
-        "save_rate": lambda save_rate: save_rate > 0
+        "save_rate": lambda save_rate: save_rate > 0,
+        "target_fps": lambda target_fps: target_fps >= 0
     }
     """Stores checks for specific settings"""
 
@@ -331,7 +336,8 @@ def _check_settings(config: Configuration) -> None:
         "top": "be greater or equal to zero",
         "bottom": "be greater or equal to zero",
         "image_format": "be one of the following values, jpeg, jpg, png, gif, bmp, tiff or tif",
-        "save_rate": "be greater than zero"
+        "save_rate": "be greater than zero",
+        "target_fps": "be greater or equal to zero"
     }
     """Stores the error messages if a check of :py:data:`_settings_value_checks` fails"""
 
@@ -0,0 +1,467 @@
+"""Contains the functions that draw shapes on the canvas
+
+The rasterizers compute the pixels of a whole shape in one pass, as horizontal spans
+or as pixels with a coverage, and then write them directly to the framebuffer of
+:file:`casioplot.py`, without calling :py:func:`casioplot.casioplot.set_pixel` for every pixel.
+
+Available functions for the user:
+  - :py:func:`draw_line`
+  - :py:func:`draw_aa_line`
+  - :py:func:`draw_lines`
+  - :py:func:`draw_polygon`
+  - :py:func:`draw_circle`
+  - :py:func:`draw_ellipse`
+  - :py:func:`draw_triangles`
+"""
+
+from collections.abc import Sequence
+from math import ceil, floor
+
+import casioplot.casioplot as _screen
+from casioplot.casioplot import _BLACK
+from casioplot.settings import _settings
+from casioplot.types import Color, Span
+
+
+# rasterizers
+
+
+def _line_spans(x0: int, y0: int, x1: int, y1: int) -> list[Span]:
+    """Computes the pixels of a line with the Bresenham algorithm
+
+    The consecutive pixels of the same row are grouped in a single span,
+    so a nearly horizontal line is written with a few slice assignments.
+
+    :return: The spans of the line
+    """
+    spans = []
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    error = dx + dy
+    run_start = x0
+
+    while True:
+        if x0 == x1 and y0 == y1:
+            spans.append((y0, min(run_start, x0), max(run_start, x0) + 1))
+            return spans
+
+        e2 = 2 * error
+        step_x = e2 >= dy
+        step_y = e2 <= dx
+        if step_y:  # the row ends here
+            spans.append((y0, min(run_start, x0), max(run_start, x0) + 1))
+        if step_x:
+            error += dy
+            x0 += sx
+        if step_y:
+            error += dx
+            y0 += sy
+            run_start = x0
+
+
+def _aa_line_pixels(x0: float, y0: float, x1: float, y1: float) -> list[tuple[int, int, float]]:
+    """Computes the pixels of an anti-aliased line with the Xiaolin Wu algorithm
+
+    :return: The pixels ``(x, y, coverage)`` of the line
+    """
+    pixels = []
+    steep = abs(y1 - y0) > abs(x1 - x0)
+    if steep:
+        x0, y0, x1, y1 = y0, x0, y1, x1
+    if x0 > x1:
+        x0, y0, x1, y1 = x1, y1, x0, y0
+
+    dx = x1 - x0
+    gradient = (y1 - y0) / dx if dx != 0 else 1.0
+
+    def plot(x: int, y: int, coverage: float) -> None:
+        pixels.append((y, x, coverage) if steep else (x, y, coverage))
+
+    # first end point
+    x_end = floor(x0 + 0.5)
+    y_end = y0 + gradient * (x_end - x0)
+    x_gap = 1 - (x0 + 0.5 - floor(x0 + 0.5))
+    x_start = x_end
+    y_pixel = floor(y_end)
+    plot(x_start, y_pixel, (1 - (y_end - y_pixel)) * x_gap)
+    plot(x_start, y_pixel + 1, (y_end - y_pixel) * x_gap)
+    inter_y = y_end + gradient
+
+    # second end point
+    x_end = floor(x1 + 0.5)
+    y_end = y1 + gradient * (x_end - x1)
+    x_gap = x1 + 0.5 - floor(x1 + 0.5)
+    x_stop = x_end
+    y_pixel = floor(y_end)
+    plot(x_stop, y_pixel, (1 - (y_end - y_pixel)) * x_gap)
+    plot(x_stop, y_pixel + 1, (y_end - y_pixel) * x_gap)
+
+    # main loop
+    for x in range(x_start + 1, x_stop):
+        y_pixel = floor(inter_y)
+        fraction = inter_y - y_pixel
+        plot(x, y_pixel, 1 - fraction)
+        plot(x, y_pixel + 1, fraction)
+        inter_y += gradient
+
+    return pixels
+
+
+def _polygon_spans(points: Sequence[tuple[float, float]], y_min: int, y_max: int) -> list[Span]:
+    """Computes the pixels inside a polygon with an edge table scanline algorithm
+
+    A pixel is inside if its center is inside the polygon (even-odd rule).
+    Only the rows from ``y_min`` to ``y_max`` (excluded) are computed, so the rows outside the canvas cost nothing.
+
+    :param points: The vertices of the polygon
+    :param y_min: The first row that is computed
+    :param y_max: The row after the last one that is computed
+    :return: The spans inside the polygon
+    """
+    # edge table, every edge is (first row, row after the last one, x at the center of the first row, slope)
+    edges = []
+    for i in range(len(points)):
+        (xa, ya), (xb, yb) = points[i - 1], points[i]
+        if ya > yb:
+            xa, ya, xb, yb = xb, yb, xa, ya
+        first_row, end_row = ceil(ya - 0.5), ceil(yb - 0.5)  # rows whose center is in [ya, yb)
+        if first_row >= end_row:  # horizontal edges and edges between two row centers are ignored
+            continue
+        slope = (xb - xa) / (yb - ya)
+        edges.append((first_row, end_row, xa + (first_row + 0.5 - ya) * slope, slope))
+    edges.sort()
+
+    spans = []
+    active: list[list[float]] = []  # active edge table, every edge is [row after the last one, current x, slope]
+    next_edge = 0
+    y = max(edges[0][0], y_min) if edges else y_max
+    end = min(max((edge[1] for edge in edges), default=y_max), y_max)
+    while y < end:
+        while next_edge < len(edges) and edges[next_edge][0] <= y:
+            first_row, end_row, x, slope = edges[next_edge]
+            active.append([end_row, x + (y - first_row) * slope, slope])
+            next_edge += 1
+        active = [edge for edge in active if edge[0] > y]
+
+        crossings = sorted(edge[1] for edge in active)
+        for i in range(0, len(crossings) - 1, 2):
+            x0, x1 = ceil(crossings[i] - 0.5), ceil(crossings[i + 1] - 0.5)
+            if x0 < x1:
+                spans.append((y, x0, x1))
+
+        for edge in active:
+            edge[1] += edge[2]
+        y += 1
+
+    return spans
+
+
+def _ellipse_half_widths(radius_x: int, radius_y: int) -> list[int]:
+    """Computes the half width of every row of an ellipse with the midpoint algorithm
+
+    :return: The half widths, the index is the distance from the center row
+    """
+    half_widths = [0] * (radius_y + 1)
+    rx2, ry2 = radius_x * radius_x, radius_y * radius_y
+    x, y = 0, radius_y
+    dx, dy = 0, 2 * rx2 * y
+
+    # region 1, the slope is smaller than 1
+    decision = ry2 - rx2 * radius_y + rx2 / 4
+    while dx < dy:
+        half_widths[y] = x
+        x += 1
+        dx += 2 * ry2
+        if decision < 0:
+            decision += dx + ry2
+        else:
+            y -= 1
+            dy -= 2 * rx2
+            decision += dx - dy + ry2
+
+    # region 2, the slope is greater than 1
+    decision = ry2 * (x + 0.5) ** 2 + rx2 * (y - 1) ** 2 - rx2 * ry2
+    while y >= 0:
+        half_widths[y] = max(half_widths[y], x)
+        y -= 1
+        dy -= 2 * rx2
+        if decision > 0:
+            decision += rx2 - dy
+        else:
+            x += 1
+            dx += 2 * ry2
+            decision += dx - dy + rx2
+
+    return half_widths
+
+
+def _ellipse_spans(x: int, y: int, radius_x: int, radius_y: int, filled: bool) -> list[Span]:
+    """Computes the pixels of an ellipse, or of its outline, as spans
+
+    :return: The spans of the ellipse
+    """
+    if radius_x == 0 or radius_y == 0:  # the ellipse is a line
+        return [(row, x - radius_x, x + radius_x + 1) for row in range(y - radius_y, y + radius_y + 1)]
+
+    half_widths = _ellipse_half_widths(radius_x, radius_y)
+    spans = []
+    for dy in range(-radius_y, radius_y + 1):
+        half_width = half_widths[abs(dy)]
+        if filled:
+            spans.append((y + dy, x - half_width, x + half_width + 1))
+            continue
+
+        # the outline goes from the edge of the row to the edge of the closest row, so it has no holes
+        next_rows = [half_widths[abs(dy + step)] if abs(dy + step) <= radius_y else -1 for step in (-1, 1)]
+        inner = min(next_rows)
+        left_end = max(x - inner, x - half_width + 1)
+        right_start = min(x + inner + 1, x + half_width)
+        if left_end >= right_start:  # both sides touch, a single span
+            spans.append((y + dy, x - half_width, x + half_width + 1))
+        else:
+            spans.append((y + dy, x - half_width, left_end))
+            spans.append((y + dy, right_start, x + half_width + 1))
+
+    return spans
+
+
+def _triangle_depth_plane(
+        a: Sequence[float],
+        b: Sequence[float],
+        c: Sequence[float]
+) -> tuple[float, float, float] | None:
+    """Computes the plane that gives the depth of every point of a triangle
+
+    :param a: First vertex ``(x, y, depth)``
+    :param b: Second vertex ``(x, y, depth)``
+    :param c: Third vertex ``(x, y, depth)``
+    :return: The coefficients ``(da, db, dc)`` of the plane ``depth = da * x + db * y + dc``,
+             or None if the triangle has no area
+    """
+    abx, aby, abz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    acx, acy, acz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    determinant = abx * acy - acx * aby
+    if determinant == 0:
+        return None
+    depth_x = (abz * acy - acz * aby) / determinant
+    depth_y = (abx * acz - acx * abz) / determinant
+    return depth_x, depth_y, a[2] - depth_x * a[0] - depth_y * a[1]
+
+
+def _prepare_color(color: Color, function: str) -> bytes | None:
+    """Checks a color and converts it to the format of the framebuffer
+
+    :param color: The color
+    :param function: The function that called this function, used in the debuging messages
+    :return: The bytes of a pixel or None if the color is invalid
+    """
+    if _settings["debuging_messages"]:
+        _screen._debuging_color(color, function)
+    try:
+        return _screen._native_color(color)
+    except ValueError:  # invalid colors are ignored, like set_pixel does
+        return None
+
+
+# functions for the user
+
+
+def draw_line(x0: float, y0: float, x1: float, y1: float, color: Color = _BLACK) -> None:
+    """Draw a line between two points, the coordinates are rounded to the nearest pixel
+
+    The parts of the line outside the canvas are ignored.
+
+    :param x0: x coordinate of the first point (from the left)
+    :param y0: y coordinate of the first point (from the top)
+    :param x1: x coordinate of the second point (from the left)
+    :param y1: y coordinate of the second point (from the top)
+    :param color: The color of the line
+    """
+    pixel = _prepare_color(color, "draw_line")
+    if pixel is not None:
+        _screen._draw_spans(_line_spans(round(x0), round(y0), round(x1), round(y1)), pixel)
+
+
+def draw_aa_line(x0: float, y0: float, x1: float, y1: float, color: Color = _BLACK) -> None:
+    """Draw an anti-aliased line between two points
+
+    The color of the line is blended with the pixels of the canvas, using the coverage of every pixel.
+    The coordinates don't need to be integers.
+
+    :param x0: x coordinate of the first point (from the left)
+    :param y0: y coordinate of the first point (from the top)
+    :param x1: x coordinate of the second point (from the left)
+    :param y1: y coordinate of the second point (from the top)
+    :param color: The color of the line
+    """
+    if _prepare_color(color, "draw_aa_line") is not None:
+        _screen._blend_pixels(_aa_line_pixels(x0, y0, x1, y1), color)
+
+
+def draw_lines(
+        segments: Sequence[tuple[float, float, float, float]],
+        colors: Color | Sequence[Color] = _BLACK,
+        antialiased: bool = False
+) -> None:
+    """Draw many lines in a single call
+
+    :param segments: The lines, every line is a tuple ``(x0, y0, x1, y1)``.
+                     A NumPy array with the shape ``(n, 4)`` can also be used
+    :param colors: A single color for every line or a color for each line
+    :param antialiased: Draw anti-aliased lines, like :py:func:`draw_aa_line`
+    :raise ValueError: Raise a :py:exc:`ValueError` if there isn't a color for each line
+    """
+    segments, colors = _screen._as_list(segments), _screen._as_list(colors)
+    single_color = len(colors) == 3 and not hasattr(colors[0], "__len__")
+    if not single_color and len(colors) != len(segments):
+        raise ValueError(f"colors must be a single color or have the same length as segments, "
+                         f"{len(colors)} != {len(segments)}")
+
+    if single_color:
+        pixel = _prepare_color(colors, "draw_lines")
+        if pixel is None:
+            return
+        if antialiased:
+            pixels = []
+            for x0, y0, x1, y1 in segments:
+                pixels += _aa_line_pixels(x0, y0, x1, y1)
+            _screen._blend_pixels(pixels, colors)
+        else:  # the spans of all the lines are written at once
+            spans = []
+            for x0, y0, x1, y1 in segments:
+                spans += _line_spans(round(x0), round(y0), round(x1), round(y1))
+            _screen._draw_spans(spans, pixel)
+        return
+
+    draw = draw_aa_line if antialiased else draw_line
+    for (x0, y0, x1, y1), color in zip(segments, colors):
+        draw(x0, y0, x1, y1, color)
+
+
+def draw_polygon(
+        points: Sequence[tuple[float, float]],
+        color: Color = _BLACK,
+        filled: bool = False
+) -> None:
+    """Draw a polygon, the last point is connected to the first one
+
+    The filled polygons are rasterized row by row, a pixel is drawn if its center is inside the polygon
+    (even-odd rule, so the polygon can cross itself).
+
+    :param points: The vertices of the polygon, every vertex is a tuple ``(x, y)``.
+                   A NumPy array with the shape ``(n, 2)`` can also be used
+    :param color: The color of the polygon
+    :param filled: Fill the polygon instead of drawing its outline
+    """
+    pixel = _prepare_color(color, "draw_polygon")
+    points = _screen._as_list(points)
+    if pixel is None or len(points) == 0:
+        return
+
+    if filled:
+        spans = _polygon_spans(points, *_screen._visible_rows())
+    else:
+        spans = []
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            spans += _line_spans(round(x0), round(y0), round(x1), round(y1))
+    _screen._draw_spans(spans, pixel)
+
+
+def draw_circle(x: int, y: int, radius: int, color: Color = _BLACK, filled: bool = False) -> None:
+    """Draw a circle with the given center and radius
+
+    :param x: x coordinate of the center (from the left)
+    :param y: y coordinate of the center (from the top)
+    :param radius: Radius of the circle in pixels
+    :param color: The color of the circle
+    :param filled: Fill the circle instead of drawing its outline
+    """
+    draw_ellipse(x, y, radius, radius, color, filled)
+
+
+def draw_ellipse(
+        x: int,
+        y: int,
+        radius_x: int,
+        radius_y: int,
+        color: Color = _BLACK,
+        filled: bool = False
+) -> None:
+    """Draw an ellipse with the given center and radii, its axes are parallel to the borders of the canvas
+
+    :param x: x coordinate of the center (from the left)
+    :param y: y coordinate of the center (from the top)
+    :param radius_x: Horizontal radius in pixels
+    :param radius_y: Vertical radius in pixels
+    :param color: The color of the ellipse
+    :param filled: Fill the ellipse instead of drawing its outline
+    """
+    pixel = _prepare_color(color, "draw_ellipse")
+    if pixel is None or radius_x < 0 or radius_y < 0:
+        return
+    _screen._draw_spans(_ellipse_spans(round(x), round(y), round(radius_x), round(radius_y), filled), pixel)
+
+
+def draw_triangles(
+        vertices: Sequence[Sequence[float]],
+        indices: Sequence[tuple[int, int, int]],
+        colors: Color | Sequence[Color] = _BLACK,
+        depth_test: bool = False,
+        cull_back_faces: bool = False
+) -> None:
+    """Draw a mesh of filled triangles in a single call
+
+    Every vertex is ``(x, y)`` or ``(x, y, depth)`` in canvas coordinates.
+    With ``depth_test`` the pixels are compared with the depth buffer of the canvas,
+    so the triangles hide each other correctly whatever the order they are drawn in,
+    a smaller depth is closer. Use :py:func:`casioplot.casioplot.clear_depth_buffer`,
+    or :py:func:`casioplot.casioplot.clear_screen`, before drawing a new frame.
+
+    :param vertices: The vertices, a NumPy array with the shape ``(n, 2)`` or ``(n, 3)`` can also be used
+    :param indices: The triangles, every triangle is a tuple with the indices of its three vertices.
+                    A NumPy array with the shape ``(m, 3)`` can also be used
+    :param colors: A single color for every triangle or a color for each triangle
+    :param depth_test: Use the depth buffer, the vertices must have a depth
+    :param cull_back_faces: Don't draw the triangles whose vertices are in clockwise order on the canvas
+    :raise ValueError: Raise a :py:exc:`ValueError` if there isn't a color for each triangle
+    """
+    vertices, indices, colors = _screen._as_list(vertices), _screen._as_list(indices), _screen._as_list(colors)
+    single_color = len(colors) == 3 and not hasattr(colors[0], "__len__")
+    if not single_color and len(colors) != len(indices):
+        raise ValueError(f"colors must be a single color or have the same length as indices, "
+                         f"{len(colors)} != {len(indices)}")
+
+    if single_color:
+        pixel = _prepare_color(colors, "draw_triangles")
+        if pixel is None:
+            return
+        pixels = [pixel] * len(indices)
+    else:
+        pixels = [_prepare_color(color, "draw_triangles") for color in colors]
+
+    y_min, y_max = _screen._visible_rows()
+    spans: list[Span] = []  # without depth test the spans of the triangles with the same color are drawn at once
+    for (i, j, k), pixel in zip(indices, pixels):
+        if pixel is None:
+            continue
+        a, b, c = vertices[i], vertices[j], vertices[k]
+
+        if cull_back_faces:
+            # with the y axis going down the counterclockwise triangles have a negative signed area
+            if (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1]) >= 0:
+                continue
+
+        triangle_spans = _polygon_spans(((a[0], a[1]), (b[0], b[1]), (c[0], c[1])), y_min, y_max)
+        if depth_test:
+            plane = _triangle_depth_plane(a, b, c)
+            if plane is not None:
+                _screen._draw_depth_spans(triangle_spans, pixel, plane)
+        elif single_color:
+            spans += triangle_spans
+        else:
+            _screen._draw_spans(triangle_spans, pixel)
+
+    if spans:
+        _screen._draw_spans(spans, pixels[0])
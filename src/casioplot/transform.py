@@ -0,0 +1,196 @@
+"""Contains the functions that transform 3D vertices into coordinates of the canvas
+
+The vertices are transformed with a 3x3 or a 4x4 matrix in a single call.
+If NumPy is installed the whole array is transformed at once, otherwise a pure python version is used.
+NumPy is only imported the first time it is needed, so it doesn't slow down the import of :py:mod:`casioplot`.
+The results can be given directly to :py:func:`casioplot.shapes.draw_triangles`,
+and to :py:func:`casioplot.shapes.draw_lines` with :py:func:`edge_segments`.
+
+Available functions for the user:
+  - :py:func:`transform_vertices`
+  - :py:func:`edge_segments`
+  - :py:func:`rotation_matrix`
+  - :py:func:`translation_matrix`
+  - :py:func:`perspective_matrix`
+  - :py:func:`combine_matrices`
+"""
+
+from collections.abc import Sequence
+from functools import cache
+from math import cos, sin
+
+from casioplot.types import Matrix
+
+
+@cache
+def _import_numpy():
+    """Imports NumPy the first time it is needed
+
+    :return: The module, or None if NumPy isn't installed
+    """
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional, the pure python version is used without it
+        return None
+    return numpy
+
+
+def _to_rows(matrix: Matrix) -> list[list[float]]:
+    """Converts a matrix to a list of rows and checks its shape
+
+    :raise ValueError: Raise a :py:exc:`ValueError` if the matrix isn't 3x3 or 4x4
+    """
+    rows = [[float(value) for value in row] for row in matrix]
+    if len(rows) not in (3, 4) or any(len(row) != len(rows) for row in rows):
+        raise ValueError("The matrix must be 3x3 or 4x4")
+    return rows
+
+
+def _to_4x4(matrix: Matrix) -> list[list[float]]:
+    """Converts a 3x3 matrix to the equivalent 4x4 matrix, 4x4 matrices are only copied"""
+    rows = _to_rows(matrix)
+    if len(rows) == 4:
+        return rows
+    return [row + [0.0] for row in rows] + [[0.0, 0.0, 0.0, 1.0]]
+
+
+def transform_vertices(vertices: Sequence[Sequence[float]], matrix: Matrix, offset: tuple[float, float] = (0, 0)):
+    """Transform vertices and project them on the canvas
+
+    Every vertex ``(x, y, z)`` is multiplied by the matrix. With a 4x4 matrix the vertex is
+    ``(x, y, z, 1)`` and the result is divided by its fourth coordinate, so perspective matrices can be used.
+    The offset is then added to the x and y coordinates, usually to move the origin to the center of the canvas.
+
+    :param vertices: The vertices, a NumPy array with the shape ``(n, 3)`` can also be used
+    :param matrix: The 3x3 or 4x4 transformation matrix
+    :param offset: Added to the x and y coordinates of the transformed vertices
+    :return: The transformed vertices ``(x, y, depth)``. A NumPy array with the shape ``(n, 3)``
+             if NumPy is installed, a list of tuples otherwise
+    :raise ValueError: Raise a :py:exc:`ValueError` if the matrix isn't 3x3 or 4x4
+    """
+    rows = _to_rows(matrix)
+    offset_x, offset_y = offset
+
+    numpy = _import_numpy()
+    if numpy is not None:
+        points = numpy.asarray(vertices, dtype=float).reshape(-1, 3)
+        array = numpy.asarray(rows)
+        if len(rows) == 4:
+            transformed = points @ array[:, :3].T + array[:, 3]
+            w = transformed[:, 3:]
+            transformed = transformed[:, :3] / numpy.where(w == 0, 1.0, w)
+        else:
+            transformed = points @ array.T
+        transformed[:, 0] += offset_x
+        transformed[:, 1] += offset_y
+        return transformed
+
+    if hasattr(vertices, "tolist"):
+        vertices = vertices.tolist()
+
+    result = []
+    if len(rows) == 4:
+        (a, b, c, d), (e, f, g, h), (i, j, k, l), (m, n, o, p) = rows
+        for x, y, z in vertices:
+            w = m * x + n * y + o * z + p
+            if w == 0:
+                w = 1.0
+            result.append((
+                (a * x + b * y + c * z + d) / w + offset_x,
+                (e * x + f * y + g * z + h) / w + offset_y,
+                (i * x + j * y + k * z + l) / w
+            ))
+    else:
+        (a, b, c), (e, f, g), (i, j, k) = rows
+        for x, y, z in vertices:
+            result.append((
+                a * x + b * y + c * z + offset_x,
+                e * x + f * y + g * z + offset_y,
+                i * x + j * y + k * z
+            ))
+    return result
+
+
+def edge_segments(points: Sequence[Sequence[float]], edges: Sequence[tuple[int, int]]):
+    """Creates the segments of the edges of a mesh, to draw it with :py:func:`casioplot.shapes.draw_lines`
+
+    :param points: The transformed vertices, see :py:func:`transform_vertices`
+    :param edges: The edges, every edge is a tuple with the indices of its two vertices
+    :return: The segments ``(x0, y0, x1, y1)``. A NumPy array with the shape ``(n, 4)``
+             if NumPy is installed, a list of tuples otherwise
+    """
+    numpy = _import_numpy()
+    if numpy is not None:
+        points = numpy.asarray(points, dtype=float)
+        edges = numpy.asarray(edges, dtype=int).reshape(-1, 2)
+        return numpy.concatenate((points[edges[:, 0], :2], points[edges[:, 1], :2]), axis=1)
+
+    if hasattr(points, "tolist"):
+        points = points.tolist()
+    return [(points[i][0], points[i][1], points[j][0], points[j][1]) for i, j in edges]
+
+
+def rotation_matrix(angle_x: float = 0, angle_y: float = 0, angle_z: float = 0) -> list[list[float]]:
+    """Creates a 3x3 rotation matrix, the rotations are done around x, then y, then z
+
+    :param angle_x: Rotation around the x axis in radians
+    :param angle_y: Rotation around the y axis in radians
+    :param angle_z: Rotation around the z axis in radians
+    :return: The matrix
+    """
+    cx, sx = cos(angle_x), sin(angle_x)
+    cy, sy = cos(angle_y), sin(angle_y)
+    cz, sz = cos(angle_z), sin(angle_z)
+    return [
+        [cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx],
+        [sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx],
+        [-sy, cy * sx, cy * cx],
+    ]
+
+
+def translation_matrix(x: float = 0, y: float = 0, z: float = 0) -> list[list[float]]:
+    """Creates a 4x4 translation matrix
+
+    :return: The matrix
+    """
+    return [
+        [1.0, 0.0, 0.0, x],
+        [0.0, 1.0, 0.0, y],
+        [0.0, 0.0, 1.0, z],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def perspective_matrix(focal_length: float) -> list[list[float]]:
+    """Creates a 4x4 perspective matrix, the camera is at the origin and looks towards positive z
+
+    The projected x and y are ``focal_length * x / z`` and ``focal_length * y / z``
+    and the depth is ``-1 / z``, so the closer vertices have a smaller depth.
+
+    :param focal_length: The distance between the camera and the projection plane, in pixels
+    :return: The matrix
+    """
+    return [
+        [focal_length, 0.0, 0.0, 0.0],
+        [0.0, focal_length, 0.0, 0.0],
+        [0.0, 0.0, 0.0, -1.0],
+        [0.0, 0.0, 1.0, 0.0],
+    ]
+
+
+def combine_matrices(*matrices: Matrix) -> list[list[float]]:
+    """Combines matrices into a single 4x4 matrix, the first matrix is the last transformation applied
+
+    :python:`combine_matrices(projection, translation, rotation)` rotates, then translates, then projects.
+    3x3 matrices are converted to 4x4 matrices first.
+
+    :return: The product of the matrices
+    """
+    result = [[float(row == column) for column in range(4)] for row in range(4)]
+    for matrix in matrices:
+        other = _to_4x4(matrix)
+        result = [
+            [sum(result[row][k] * other[k][column] for k in range(4)) for column in range(4)]
+            for row in range(4)
+        ]
+    return result
@@ -1,5 +1,7 @@
-"""This file contains the types :py:class:`Configuration`, :py:class:`Color` and :py:class:`Text_size`"""
+"""This file contains the types :py:class:`Configuration`, :py:class:`Color`, :py:class:`Text_size`,
+:py:class:`Rect`, :py:class:`Span` and :py:class:`Matrix`"""
 
+from collections.abc import Sequence
 from typing import TypedDict, Literal
 
 
@@ -25,6 +27,8 @@ class Configuration(TypedDict):
     # showing_screen
     show_screen: bool  # do not mistake for the function `show_screen` from `casioplot.py
     close_window: bool  # close the window at exit
+    target_fps: int  # the number of frames shown per second by `show_screen`, 0 shows them as fast as possible
+    skip_frames: bool  # skip showing the frames when the program is late, only with a target_fps
 
     # saving_screen
     save_screen: bool  # Save the screen as an image
@@ -40,6 +44,11 @@ class Configuration(TypedDict):
     debuging_messages: bool  # activates debuging messages that warn if the program is trying to use get_pixel,
     # set_pixel or draw_string with coordinates outside the canvas
 
+    rgb565: bool  # stores the canvas with 2 bytes per pixel, like the screen of the casio calculators,
+    # the colors are always corrected in this mode
+
+    text_cache_size: int  # memory in bytes used to keep the strings drawn by `draw_string`, 0 disables the cache
+
 Color = tuple[int, int, int]
 """A color is represented as a tuple of three integers, each integer is in the range [0, 255] and represents the
 intensity of the color in the red, green and blue channels respectively."""
@@ -47,3 +56,17 @@ intensity of the color in the red, green and blue channels respectively."""
 
 Text_size = Literal["small", "medium", "large"]
 """The three accpeted text sizes"""
+
+
+Rect = tuple[int, int, int, int]
+"""A rectangle of the canvas represented as a tuple ``(x0, y0, x1, y1)``, (x0, y0) is the top left pixel
+of the rectangle and (x1, y1) is the pixel just after the bottom right one, so the width is ``x1 - x0``."""
+
+
+Span = tuple[int, int, int]
+"""A horizontal span of pixels represented as a tuple ``(y, x0, x1)``, it goes from the pixel (x0, y)
+to the pixel just before (x1, y), so its length is ``x1 - x0``."""
+
+
+Matrix = Sequence[Sequence[float]]
+"""A 3x3 or 4x4 matrix represented as a sequence of rows, a NumPy array can also be used."""